@@ -0,0 +1,93 @@
+"""
+Benchmark of the memory footprint per node type.
+
+Compares the slot-based node classes of :mod:`wordmill.node_types` with the previous
+layout (instance `__dict__`, four lists allocated per node, input/output tuples built from
+lists), and the retained and peak memory of generated systems with the estimates of
+:mod:`wordmill.registry`. Both ratios have to stay below one. Run with::
+
+    PYTHONPATH=. python benchmarks/memory_per_node.py
+"""
+import tracemalloc
+
+from wordmill import Inventory, Machine, Source, Sink, AssemblySystem
+from wordmill.algorithms import form_bio_inspired_assembly
+from wordmill.registry import get_generator
+
+N = 100000
+
+
+class LegacyNode:
+    """
+    Node with the memory layout used before the introduction of slots.
+    """
+    def __init__(self, inputs, outputs):
+        self._inputs = []
+        self._outputs = []
+        self._input_nodes = []
+        self._output_nodes = []
+        self._inputs = tuple(list(inputs))
+        self._outputs = tuple(list(outputs))
+
+
+def bytes_per_instance(factory) -> float:
+    """
+    Average number of bytes allocated for one instance created by `factory`.
+    """
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    instances = [factory(i) for i in range(N)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Discount the list holding the instances
+    return (end - start) / len(instances) - 8
+
+
+def main():
+    # Words are created up front so that their memory is not attributed to the nodes.
+    words = ['w{}'.format(i) for i in range(N)]
+    cases = [
+        ('Source', lambda i: Source(words[i]), lambda i: LegacyNode([], [words[i]])),
+        ('Sink', lambda i: Sink(words[i]), lambda i: LegacyNode([words[i]], [])),
+        ('Inventory', lambda i: Inventory(words[i]), lambda i: LegacyNode([words[i]], [words[i]])),
+        (
+            'Machine',
+            lambda i: Machine(words[i], words[i - 1]),
+            lambda i: LegacyNode([words[i], words[i - 1]], [words[i] + words[i - 1]])
+        ),
+    ]
+    print('{:<12}{:>12}{:>12}{:>10}'.format('node type', 'legacy [B]', 'slots [B]', 'ratio'))
+    for name, factory, legacy_factory in cases:
+        legacy = bytes_per_instance(legacy_factory)
+        current = bytes_per_instance(factory)
+        print('{:<12}{:>12.0f}{:>12.0f}{:>10.2f}'.format(name, legacy, current, current / legacy))
+
+    # Retained and peak footprint of generated systems compared to the estimates used for
+    # memory budgets (see wordmill.registry).
+    AssemblySystem.generate(form_bio_inspired_assembly, 'ab')
+    systems = [
+        ('bio_inspired', ['abcdefghijklmnopqrstuvwxyz' * 2]),
+        ('linear', ['{:08d}'.format(i * 7919) for i in range(5000)]),
+        ('component', ['{:030d}'.format(i * 7919) for i in range(1000)]),
+        ('product_focussed_team', ['abcdefghijklmnopqrst', 'bcdefghijklmnopqrstu']),
+    ]
+    print()
+    print('{:<24}{:>8}{:>12}{:>12}{:>12}{:>12}'.format(
+        'system', 'nodes', 'ret. [B/n]', 'peak [B/n]', 'ret./est.', 'peak/est.'
+    ))
+    for name, words in systems:
+        tracemalloc.start()
+        system = AssemblySystem.generate(name, *words)
+        size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        estimate = get_generator(name).estimate_size(words)
+        n_nodes = len(system.get_nodes_of_type(object))
+        print('{:<24}{:>8}{:>12.0f}{:>12.0f}{:>12.2f}{:>12.2f}'.format(
+            name, n_nodes, size / n_nodes, peak / n_nodes,
+            size / estimate.retained_memory, peak / estimate.memory
+        ))
+        del system
+
+
+if __name__ == '__main__':
+    main()
@@ -1,2 +1,3 @@
 # Input content of node_types submodule to make them available from module root.
-from wordmill.node_types import Node, Inventory, Machine, Source, Sink, form_edge, AssemblySystem
+from wordmill.node_types import Node, Inventory, Machine, Source, Sink, form_edge, remove_edge, \
+    AssemblySystem
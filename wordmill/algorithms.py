@@ -1,9 +1,13 @@
-from wordmill.node_types import Node, Machine, Inventory, form_edge
+from wordmill.node_types import Node, Machine, Inventory, Word, form_edge
+from wordmill.registry import register_generator, estimate_tree, estimate_standard_products, \
+    share_all, share_standard_products
+from wordmill.estimation import estimate_distinct_substrings, estimate_team_substrings
 import math
 from typing import Dict
 
 
-def form_linear_assembly(sources: Dict[str, Node], sinks: Dict[str, Node]):
+@register_generator('linear', estimate_tree, streaming=True)
+def form_linear_assembly(sources: Dict[Word, Node], sinks: Dict[Word, Node]):
     inventories_to_supply = []
     for w_out, sink in sinks.items():
         inv = Inventory(w_out)
@@ -26,7 +30,8 @@ def form_linear_assembly(sources: Dict[str, Node], sinks: Dict[str, Node]):
             inventories_to_supply.append(inv_right)
 
 
-def form_component_assembly(sources: Dict[str, Node], sinks: Dict[str, Node]):
+@register_generator('component', estimate_tree, streaming=True)
+def form_component_assembly(sources: Dict[Word, Node], sinks: Dict[Word, Node]):
     inventories_to_supply = []
     for w_out, sink in sinks.items():
         inv = Inventory(w_out)
@@ -49,7 +54,12 @@ def form_component_assembly(sources: Dict[str, Node], sinks: Dict[str, Node]):
             inventories_to_supply.append(inv_right)
 
 
-def form_bio_inspired_assembly(sources: Dict[str, Node], sinks: Dict[str, Node]):
+@register_generator(
+    'bio_inspired',
+    estimate_distinct_substrings,
+    share_key=share_all
+)
+def form_bio_inspired_assembly(sources: Dict[Word, Node], sinks: Dict[Word, Node]):
     inventories_to_supply = []
     created_inventories = dict()
     created_machines = dict()
@@ -90,7 +100,12 @@ def form_bio_inspired_assembly(sources: Dict[str, Node], sinks: Dict[str, Node])
                 form_edge(inv_right, m)
 
 
-def form_product_focussed_team_assembly(sources: Dict[str, Node], sinks: Dict[str, Node]):
+@register_generator(
+    'product_focussed_team',
+    estimate_team_substrings,
+    streaming=True
+)
+def form_product_focussed_team_assembly(sources: Dict[Word, Node], sinks: Dict[Word, Node]):
     inventory_pairs = []
     for w_out, sink in sinks.items():
         inv = Inventory(w_out)
@@ -143,8 +158,13 @@ def form_product_focussed_team_assembly(sources: Dict[str, Node], sinks: Dict[st
                         created_inventories[w_right] = inv_right
                     form_edge(inv_right, m)
 
-                    
-def form_late_product_differentiation(sources: Dict[str, Node], sinks: Dict[str, Node], w_standard):
+
+@register_generator(
+    'late_product_differentiation',
+    estimate_standard_products,
+    share_key=share_standard_products
+)
+def form_late_product_differentiation(sources: Dict[Word, Node], sinks: Dict[Word, Node], w_standard):
     inventories_for_standard_products = dict()
     
     def get_inventory_for_standard_product(w):
@@ -155,12 +175,19 @@ def form_late_product_differentiation(sources: Dict[str, Node], sinks: Dict[str,
             inventories_for_standard_products[w] = inv
         return inventories_for_standard_products[w]
     
+    # Candidates are tried longest first, ties are broken by the order of `w_standard`. Sets are
+    # sorted first, so that the result does not depend on the hash seed.
+    candidates = sorted(
+        sorted(w_standard) if isinstance(w_standard, (set, frozenset)) else w_standard,
+        key=len,
+        reverse=True
+    )
+
     def get_longest_standard_product_in(w):
-        best = None
-        for c in w_standard:
-            if c != w and c in w and (best is None or len(c) > len(best)):
-                best = c
-        return best
+        for c in candidates:
+            if c != w and Node.find_word(w, c) >= 0:
+                return c
+        return None
 
     inventories_to_supply = []
 
@@ -189,8 +216,9 @@ def form_late_product_differentiation(sources: Dict[str, Node], sinks: Dict[str,
                 inventories_to_supply.append(inv_left)
                 inventories_to_supply.append(inv_right)
             else:
-                w_head = w[:w.index(wst)]
-                w_tail = w[w.index(wst) + len(wst):]
+                pos = Node.find_word(w, wst)
+                w_head = w[:pos]
+                w_tail = w[pos + len(wst):]
                 
                 if len(w_head) > 0:
                     if w_head in w_standard:
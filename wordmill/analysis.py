@@ -0,0 +1,234 @@
+"""
+Structural analyses of :class:`~wordmill.node_types.AssemblySystem` instances.
+
+All analyses operate on the cached topological order of a system
+(:attr:`AssemblySystem.topological_order`) and need a single linear pass over
+the nodes. This keeps repeated "what-if" queries with changed processing times
+cheap, as the order does not need to be recomputed.
+
+An assembly system is treated as an AND/OR graph: a :class:`Machine` requires
+all of its input words, while an :class:`Inventory` can be filled by any of its
+supplying machines (alternatives, e.g. in
+:func:`~wordmill.algorithms.form_bio_inspired_assembly`).
+"""
+from __future__ import annotations
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+from wordmill.node_types import Node, Machine, Source, Sink, AssemblySystem
+
+
+class CriticalPath:
+    """
+    Result of :func:`critical_paths` for a single :class:`Sink`.
+    """
+    def __init__(
+            self,
+            sink: Sink,
+            lead_time: float,
+            path: List[Node],
+            bottleneck: Optional[Machine],
+            cycle_time: float
+    ):
+        """
+        Constructor.
+
+        Args:
+            sink: Sink for which the path was computed.
+            lead_time: Length (sum of machine processing times) of the critical path.
+            path: Nodes on the critical path, starting at a :class:`Source` and
+                ending at `sink`.
+            bottleneck: Machine with the longest processing time on `path`, which limits
+                the throughput along the critical path (``None`` if the sink is fed
+                directly from a source).
+            cycle_time: Processing time of `bottleneck` (0 if there is none).
+        """
+        self.sink = sink
+        self.lead_time = lead_time
+        self.path = path
+        self.bottleneck = bottleneck
+        self.cycle_time = cycle_time
+
+    @property
+    def machines(self) -> List[Machine]:
+        """
+        Machines on the critical path.
+
+        Returns:
+            Machines on the critical path, in order of material flow.
+        """
+        return [n for n in self.path if isinstance(n, Machine)]
+
+    def __repr__(self) -> str:
+        return 'CriticalPath(sink={!r}, lead_time={}, cycle_time={})'.format(
+            self.sink.word, self.lead_time, self.cycle_time
+        )
+
+
+def critical_paths(
+        system: AssemblySystem,
+        processing_times: Optional[Dict[Machine, float]] = None,
+        default_time: float = 1.0
+) -> Dict[Sink, CriticalPath]:
+    """
+    Compute the critical (longest lead time) path from the sources to every sink
+    together with the bottleneck machine on that path.
+
+    The computation is a dynamic program over the topological order of the
+    system:
+
+    * A :class:`Machine` is finished after its slowest input plus its own
+      processing time.
+    * An :class:`Inventory` is filled by its fastest supplying machine, i.e. the
+      minimum over all alternatives is taken.
+
+    For systems without alternative machines this reduces to the classical longest
+    path computation. The bottleneck is the slowest machine on the critical path.
+    Note that machines on other branches that feed the same sink may be even slower.
+
+    Args:
+        system: Assembly system to analyse.
+        processing_times: Processing time per machine.
+        default_time: Processing time of machines missing from `processing_times`.
+
+    Returns:
+        Dictionary, keyed by sinks, holding :class:`CriticalPath` instances.
+    """
+    if processing_times is None:
+        processing_times = {}
+    # Earliest completion time and predecessor on the critical path per node.
+    lead_time: Dict[Node, float] = {}
+    predecessor: Dict[Node, Optional[Node]] = {}
+    for n in system.topological_order:
+        if isinstance(n, Source) or len(n.input_nodes) == 0:
+            lead_time[n] = 0.0
+            predecessor[n] = None
+        elif isinstance(n, Machine):
+            slowest = max(n.input_nodes, key=lead_time.__getitem__)
+            lead_time[n] = lead_time[slowest] + processing_times.get(n, default_time)
+            predecessor[n] = slowest
+        else:
+            # Inventories and sinks can use any of their inputs.
+            fastest = min(n.input_nodes, key=lead_time.__getitem__)
+            lead_time[n] = lead_time[fastest]
+            predecessor[n] = fastest
+
+    result = {}
+    for sink in system.get_nodes_of_type(Sink):
+        path = []
+        n = sink
+        while n is not None:
+            path.append(n)
+            n = predecessor[n]
+        path.reverse()
+        machines = [m for m in path if isinstance(m, Machine)]
+        if len(machines) > 0:
+            bottleneck = max(machines, key=lambda m: processing_times.get(m, default_time))
+            t = processing_times.get(bottleneck, default_time)
+        else:
+            bottleneck, t = None, 0.0
+        result[sink] = CriticalPath(sink, lead_time[sink], path, bottleneck, t)
+    return result
+
+
+def bottlenecks(
+        system: AssemblySystem,
+        processing_times: Optional[Dict[Machine, float]] = None,
+        default_time: float = 1.0
+) -> Dict[Sink, Optional[Machine]]:
+    """
+    Determine the slowest machine on the critical path to every sink.
+
+    Args:
+        system: Assembly system to analyse.
+        processing_times: Processing time per machine.
+        default_time: Processing time of machines missing from `processing_times`.
+
+    Returns:
+        Dictionary, keyed by sinks, holding the bottleneck machines.
+
+    See Also:
+        :func:`critical_paths` for a description of the underlying computation.
+    """
+    return {
+        sink: p.bottleneck
+        for sink, p in critical_paths(system, processing_times, default_time).items()
+    }
+
+
+# Machines needed by a node without copying the needs of its inputs, see
+# :func:`single_points_of_failure`: ``None`` if no machine is needed, a tuple of a machine and
+# the needs of its inputs, or a (materialized) frozenset of machines.
+_Needs = Optional[Union[Tuple[Machine, tuple], FrozenSet[Machine]]]
+
+
+def _expand(needs: _Needs) -> Set[Machine]:
+    """
+    Set of all machines in the (shared) representation `needs`, visiting every part of it once.
+    """
+    machines: Set[Machine] = set()
+    visited: Set[int] = set()
+    stack = [needs]
+    while len(stack) > 0:
+        needs = stack.pop()
+        if needs is None or id(needs) in visited:
+            continue
+        visited.add(id(needs))
+        if isinstance(needs, frozenset):
+            machines |= needs
+        else:
+            machines.add(needs[0])
+            stack.extend(needs[1])
+    return machines
+
+
+def single_points_of_failure(system: AssemblySystem) -> Dict[Machine, List[Sink]]:
+    """
+    Determine, for every machine, the sinks that lose all supply paths if the
+    machine fails.
+
+    This generalises dominator trees to the AND/OR structure of assembly systems.
+    In a single pass over the topological order, the machines that are
+    indispensable for every node are determined:
+
+    * a :class:`Machine` needs itself and everything its inputs need (union),
+    * an :class:`Inventory` or :class:`Sink` needs only what all of its
+      alternative suppliers need (intersection).
+
+    Like the immediate dominators of a dominator tree, the needs of a node are not
+    copied but refer to the needs of its inputs: a machine stores itself and
+    references to the needs of its inputs, a node with a single supplier (or with
+    suppliers that all share the same needs) shares them. Only intersections of
+    different alternatives are materialized, which keeps them small for redundant
+    designs (e.g. :func:`~wordmill.algorithms.form_bio_inspired_assembly`). The
+    needs of every sink are expanded once. Without alternatives, time and memory
+    are thus linear in the size of the system and the result.
+
+    Args:
+        system: Assembly system to analyse.
+
+    Returns:
+        Dictionary, keyed by all machines of the system, holding the sinks that
+        cannot be supplied anymore if the machine fails (empty if the machine has
+        redundant alternatives).
+    """
+    needed: Dict[Node, _Needs] = {}
+    result: Dict[Machine, List[Sink]] = {}
+    for n in system.topological_order:
+        inputs = n.input_nodes
+        if isinstance(n, Machine):
+            result[n] = []
+            needed[n] = (n, tuple(needed[i] for i in inputs if needed[i] is not None))
+        elif len(inputs) == 0:
+            needed[n] = None
+        else:
+            alternatives = [needed[i] for i in inputs]
+            if any(a is None for a in alternatives):
+                needed[n] = None
+            elif all(a is alternatives[0] for a in alternatives):
+                needed[n] = alternatives[0]
+            else:
+                needed[n] = frozenset(set.intersection(*map(_expand, alternatives))) or None
+        if isinstance(n, Sink):
+            for m in _expand(needed[n]):
+                result[m].append(n)
+    return result
@@ -0,0 +1,175 @@
+"""
+Exact size estimation of assembly systems from their output words alone.
+
+The size of the systems created by
+:func:`~wordmill.algorithms.form_bio_inspired_assembly` and
+:func:`~wordmill.algorithms.form_product_focussed_team_assembly` is determined by
+the distinct substrings of the output words: every distinct substring is held by
+one inventory and supplied by one machine per split position. The number of
+distinct substrings and their total length are counted with a generalized suffix
+automaton in time and memory linear in the total length of the words, without
+creating any :class:`~wordmill.node_types.Node`. This makes the estimators cheap
+enough to be used as an admission check on every request (see
+:meth:`GeneratorInfo.check_budget <wordmill.registry.GeneratorInfo.check_budget>`).
+"""
+from __future__ import annotations
+from typing import Dict, Hashable, List, NamedTuple, Sequence
+
+from wordmill.node_types import Word
+from wordmill.registry import SizeEstimate, bytes_per_atom
+
+
+class SubstringStats(NamedTuple):
+    """
+    Statistics of the distinct (non-empty) substrings of a set of words.
+    """
+    #: Number of distinct substrings.
+    distinct: int
+    #: Sum of the lengths of all distinct substrings.
+    total_length: int
+    #: Number of distinct substrings of length one (the alphabet).
+    alphabet: int
+    #: Sum of the squared lengths of all distinct substrings.
+    squared_length: int = 0
+
+    @property
+    def splits(self) -> int:
+        """
+        Number of split positions over all distinct substrings, i.e. the number of
+        machines needed to supply every substring via all of its splits.
+
+        Returns:
+            Number of splits.
+        """
+        return self.total_length - self.distinct
+
+    @property
+    def split_atoms(self) -> int:
+        """
+        Number of characters or tokens held by the machines of all splits. Every machine holds
+        its two input words and its output word.
+
+        Returns:
+            Number of characters or tokens.
+        """
+        return 2 * (self.squared_length - self.total_length)
+
+
+def substring_stats(words: Sequence[Word]) -> SubstringStats:
+    """
+    Count the distinct substrings of a set of words with a generalized suffix automaton.
+
+    Every state of the automaton stands for the substrings whose lengths lie between
+    the length of its suffix link target (exclusive) and its own length (inclusive),
+    and every distinct substring belongs to exactly one state.
+
+    Args:
+        words: Words (strings or sequences of tokens).
+
+    Returns:
+        Substring statistics.
+    """
+    # State 0 is the initial state. States are stored in parallel lists.
+    length: List[int] = [0]
+    link: List[int] = [-1]
+    transitions: List[Dict[Hashable, int]] = [{}]
+
+    def clone(q: int, p: int) -> int:
+        length.append(length[p] + 1)
+        link.append(link[q])
+        transitions.append(dict(transitions[q]))
+        return len(length) - 1
+
+    def extend(last: int, c: Hashable) -> int:
+        if c in transitions[last]:
+            # The extended word is already known (prefix of another word)
+            q = transitions[last][c]
+            if length[q] == length[last] + 1:
+                return q
+            r = clone(q, last)
+            p = last
+            while p != -1 and transitions[p].get(c) == q:
+                transitions[p][c] = r
+                p = link[p]
+            link[q] = r
+            return r
+        length.append(length[last] + 1)
+        link.append(0)
+        transitions.append({})
+        cur = len(length) - 1
+        p = last
+        while p != -1 and c not in transitions[p]:
+            transitions[p][c] = cur
+            p = link[p]
+        if p != -1:
+            q = transitions[p][c]
+            if length[q] == length[p] + 1:
+                link[cur] = q
+            else:
+                r = clone(q, p)
+                while p != -1 and transitions[p].get(c) == q:
+                    transitions[p][c] = r
+                    p = link[p]
+                link[q] = link[cur] = r
+        return cur
+
+    for w in words:
+        last = 0
+        for c in w:
+            last = extend(last, c)
+    distinct = total_length = squared_length = 0
+    for v in range(1, len(length)):
+        n, m = length[v], length[link[v]]
+        distinct += n - m
+        total_length += (n * (n + 1) - m * (m + 1)) // 2
+        squared_length += (n * (n + 1) * (2 * n + 1) - m * (m + 1) * (2 * m + 1)) // 6
+    return SubstringStats(distinct, total_length, len(transitions[0]), squared_length)
+
+
+def estimate_distinct_substrings(words: Sequence[Word], **kwargs) -> SizeEstimate:
+    """
+    Exact size of systems created by :func:`~wordmill.algorithms.form_bio_inspired_assembly`:
+    one inventory per distinct substring, one machine per split of a distinct substring
+    (three edges each), one source per letter and one sink per output word.
+    """
+    words = list(dict.fromkeys(words))
+    stats = substring_stats(words)
+    # Inventories, machines, sources and sinks
+    atoms = stats.total_length + stats.split_atoms + stats.alphabet + sum(len(w) for w in words)
+    return SizeEstimate(
+        stats.distinct + stats.splits + stats.alphabet + len(words),
+        3 * stats.splits + stats.alphabet + len(words),
+        atoms * bytes_per_atom(words)
+    )
+
+
+def estimate_team_substrings(words: Sequence[Word], **kwargs) -> SizeEstimate:
+    """
+    Exact size of systems created by
+    :func:`~wordmill.algorithms.form_product_focussed_team_assembly`. Every split of an output
+    word is supplied by its own team, which holds one inventory per distinct substring of both
+    parts and one machine per split of these substrings. If both parts are equal, the team
+    holds two inventories of the part, each supplied by its own machines.
+    """
+    words = list(dict.fromkeys(words))
+    atom_bytes = bytes_per_atom(words)
+    alphabet = substring_stats(words).alphabet
+    total = SizeEstimate(alphabet, 0, alphabet * atom_bytes)
+    for w in words:
+        n = len(w)
+        # Sink, final inventory and one machine per split
+        total += SizeEstimate(2 + n - 1, 1 + 3 * (n - 1), (2 * n + 2 * n * (n - 1)) * atom_bytes)
+        for i in range(1, n):
+            left, right = w[:i], w[i:]
+            stats = substring_stats([left, right])
+            inventories, machines, source_edges = stats.distinct, stats.splits, stats.alphabet
+            atoms = stats.total_length + stats.split_atoms
+            if left == right:
+                inventories += 1
+                machines += len(left) - 1
+                source_edges += len(left) == 1
+                atoms += len(left) + 2 * len(left) * (len(left) - 1)
+            total += SizeEstimate(
+                inventories + machines, 3 * machines + source_edges, atoms * atom_bytes
+            )
+    return total
@@ -0,0 +1,187 @@
+"""
+Hierarchical views of assembly systems.
+
+:func:`collapse` replaces subassemblies (all machines and inventories that
+exclusively serve a designated inventory or machine) by a single
+:class:`Assembly` super-node. The super-node consumes the words of the inventories
+at the boundary of the subassembly and provides the word of the designated node,
+so that the collapsed system is again a valid assembly system that can be
+analysed, simulated or exported at a much coarser granularity. Every super-node
+keeps a reference to the original nodes for drill-down.
+"""
+from __future__ import annotations
+from typing import Dict, Iterable, List, Sequence, Set
+
+from wordmill.node_types import Node, Inventory, Machine, Source, Sink, Word, AssemblySystem, \
+    form_edge
+
+
+class Assembly(Machine):
+    """
+    Super-node that stands for a collapsed subassembly. It behaves like a
+    :class:`Machine` with an arbitrary number of input words.
+    """
+    __slots__ = ('_members',)
+
+    def __init__(self, inputs: Sequence[Word], word: Word, members: Sequence[Node] = ()):
+        """
+        Constructor.
+
+        Args:
+            inputs: Words consumed by the subassembly.
+            word: Word provided by the subassembly.
+            members: Nodes of the detailed system that constitute the subassembly.
+        """
+        Node.__init__(self)
+        self._inputs = tuple(inputs)
+        self._outputs = (word,)
+        self._members = tuple(members)
+
+    @property
+    def members(self) -> Sequence[Node]:
+        """
+        Nodes of the detailed system that constitute the subassembly, in topological order.
+
+        Returns:
+            Sequence of nodes.
+        """
+        return self._members
+
+    def copy(self) -> Assembly:
+        return Assembly(self._inputs, self.word, self._members)
+
+    def expand(self) -> AssemblySystem:
+        """
+        Drill down into the subassembly.
+
+        Returns:
+            Standalone copy of the detailed nodes of the subassembly, see
+            :meth:`AssemblySystem.extract`.
+        """
+        return AssemblySystem.extract(self._members)
+
+
+def _region(root: Node, roots: Set[Node], position: Dict[Node, int]) -> List[Node]:
+    """
+    Machines and inventories that exclusively serve `root`, in topological order.
+    """
+    if isinstance(root, Inventory):
+        seeds = list(root.input_nodes)
+        targets = {root}
+    elif isinstance(root, Machine):
+        seeds = [root]
+        targets = set()
+    else:
+        raise ValueError('Only inventories and machines can be collapsed, got {!r}.'.format(root))
+    region = set(seeds)
+    # Collect upstream candidates. Sources, inventories fed by sources or by other roots and
+    # other roots stay outside of the region, such that subassemblies meet at inventories.
+    candidates = {}
+    stack = list(seeds)
+    while len(stack) > 0:
+        n = stack.pop()
+        for i in n.input_nodes:
+            if i in candidates or i in region or i in roots or isinstance(i, Source):
+                continue
+            if isinstance(i, Inventory) and any(
+                isinstance(j, Source) or j in roots for j in i.input_nodes
+            ):
+                continue
+            candidates[i] = position[i]
+            stack.append(i)
+    # Nodes are visited after all of their output nodes
+    for n in sorted(candidates, key=candidates.__getitem__, reverse=True):
+        if all(o in region or o in targets for o in n.output_nodes):
+            region.add(n)
+    return sorted(region, key=position.__getitem__)
+
+
+def collapse(system: AssemblySystem, roots: Iterable[Node]) -> AssemblySystem:
+    """
+    Collapse subassemblies into :class:`Assembly` super-nodes.
+
+    For an :class:`Inventory` root, all machines supplying it and all machines
+    and inventories upstream that exclusively serve these machines are replaced
+    by one super-node. For a :class:`Machine` root, the machine itself and its
+    exclusive upstream are replaced. Sources, inventories that are directly
+    supplied by sources or by other roots and other roots are never collapsed,
+    they form the boundary of the subassemblies.
+
+    Args:
+        system: Assembly system to collapse. It is not modified.
+        roots: Inventories or machines whose subassemblies are collapsed.
+
+    Returns:
+        Collapsed assembly system, made of copies of the nodes that are not part of
+        any subassembly and the super-nodes.
+
+    Raises:
+        ValueError: If a root is not an inventory or machine.
+    """
+    order = system.topological_order
+    position = {n: i for i, n in enumerate(order)}
+    roots = list(dict.fromkeys(roots))
+    root_set = set(roots)
+    # Super-node per collapsed node
+    super_node: Dict[Node, Assembly] = {}
+    for root in roots:
+        region = _region(root, root_set, position)
+        # One input per distinct boundary node
+        boundary = list(dict.fromkeys(
+            i for n in region for i in n.input_nodes if i not in region
+        ))
+        assembly = Assembly([i.word for i in boundary], root.word, region)
+        for n in region:
+            super_node[n] = assembly
+    copies = {n: n.copy() for n in order if n not in super_node}
+    formed = set()
+    for n in order:
+        for o in n.output_nodes:
+            source = super_node[n] if n in super_node else copies[n]
+            sink = super_node[o] if o in super_node else copies[o]
+            if source is sink or (source, sink) in formed:
+                continue
+            if n in super_node or o in super_node:
+                formed.add((source, sink))
+            form_edge(source, sink)
+    return AssemblySystem.discover([c for c in copies.values() if isinstance(c, (Source, Sink))])
+
+
+def standard_product_roots(system: AssemblySystem, w_standard: Iterable[Word]) -> List[Inventory]:
+    """
+    Inventories holding standard words, e.g. of systems generated by
+    :func:`~wordmill.algorithms.form_late_product_differentiation`. Standard words
+    of length one are skipped, as their inventories are supplied by sources.
+
+    Args:
+        system: Assembly system.
+        w_standard: Standard words.
+
+    Returns:
+        Inventories to pass to :func:`collapse`.
+    """
+    w_standard = set(w_standard)
+    return [
+        n for n in system.topological_order
+        if isinstance(n, Inventory) and n.word in w_standard and len(n.word) > 1
+    ]
+
+
+def team_roots(system: AssemblySystem) -> List[Machine]:
+    """
+    Machines supplying the inventories of sinks. In systems generated by
+    :func:`~wordmill.algorithms.form_product_focussed_team_assembly`, each of them
+    is the final machine of one team.
+
+    Args:
+        system: Assembly system.
+
+    Returns:
+        Machines to pass to :func:`collapse`.
+    """
+    return [
+        m
+        for n in system.topological_order if isinstance(n, Sink)
+        for i in n.input_nodes
+        for m in i.input_nodes if isinstance(m, Machine)
+    ]
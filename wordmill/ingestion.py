@@ -0,0 +1,116 @@
+"""
+Bulk ingestion of word portfolios from large files.
+
+The readers in this module stream words from memory-mapped text files or from
+columnar (Parquet) files, so that portfolios never have to be loaded into a list
+before generation. Combined with :func:`unique_words` and
+:meth:`AssemblySystem.generate_from_iterable
+<wordmill.node_types.AssemblySystem.generate_from_iterable>`, duplicates are
+removed and generating functions are fed in chunks while reading.
+"""
+from __future__ import annotations
+import mmap
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from wordmill.node_types import Word
+
+
+def read_words(path: str, encoding: str = 'utf-8', comment: Optional[str] = '#') -> Iterator[str]:
+    """
+    Stream words from a text file with one word per line. The file is memory-mapped,
+    so that only the lines currently processed are held in memory.
+
+    Args:
+        path: Path to the text file.
+        encoding: Encoding of the file.
+        comment: Lines starting with this prefix are skipped. No lines are skipped
+            if ``None``.
+
+    Returns:
+        Iterator over words. Surrounding whitespace and empty lines are dropped.
+    """
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return
+        with mm:
+            for line in iter(mm.readline, b''):
+                w = line.decode(encoding).strip()
+                if len(w) == 0 or (comment is not None and w.startswith(comment)):
+                    continue
+                yield w
+
+
+def read_words_columnar(path: str, column: str, batch_size: int = 65536) -> Iterator[Word]:
+    """
+    Stream words from a column of a `Parquet <https://parquet.apache.org/>`_ file.
+    Requires the `PyArrow <https://arrow.apache.org/docs/python/>`_ library.
+
+    Args:
+        path: Path to the Parquet file.
+        column: Name of the column holding the words. String columns yield string
+            words, columns of integer lists yield token words (tuples of token ids,
+            see :mod:`wordmill.tokens`).
+        batch_size: Number of rows read at once.
+
+    Returns:
+        Iterator over words. Missing values are dropped.
+    """
+    import pyarrow.parquet as pq
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=[column]):
+        for value in batch.column(0).to_pylist():
+            if value is None:
+                continue
+            yield value if isinstance(value, str) else tuple(value)
+
+
+def unique_words(words: Iterable[Word]) -> Iterator[Word]:
+    """
+    Remove duplicates from a stream of words while reading it. String words are
+    interned (see :func:`sys.intern`) and equal token words share one tuple, so
+    that every distinct word is held in memory only once.
+
+    Args:
+        words: Iterable of words.
+
+    Returns:
+        Iterator over the first occurrence of every word.
+    """
+    seen: Dict[Word, Word] = {}
+    for w in words:
+        if w in seen:
+            continue
+        if isinstance(w, str):
+            w = sys.intern(w)
+        seen[w] = w
+        yield w
+
+
+def chunked(words: Iterable[Word], chunk_size: int) -> Iterator[List[Word]]:
+    """
+    Group a stream of words into chunks.
+
+    Args:
+        words: Iterable of words.
+        chunk_size: Maximum number of words per chunk.
+
+    Returns:
+        Iterator over lists of words.
+
+    Raises:
+        ValueError: If `chunk_size` is smaller than one.
+    """
+    if chunk_size < 1:
+        raise ValueError('Chunk size must be positive.')
+    chunk = []
+    for w in words:
+        chunk.append(w)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if len(chunk) > 0:
+        yield chunk
@@ -0,0 +1,94 @@
+"""
+Extraction of the neighborhood of a node, e.g. to inspect the part of a large
+assembly system around one product or component.
+
+:func:`neighborhood` looks up the nodes of a word via the cached word index of
+the system (see :meth:`AssemblySystem.nodes_with_word
+<wordmill.node_types.AssemblySystem.nodes_with_word>`) and follows edges up to a
+given number of hops. Its runtime is proportional to the size of the
+neighborhood, not to the size of the system (apart from building the word index
+once). The result is a standalone copy that can be exported via
+:meth:`~wordmill.node_types.AssemblySystem.to_graphviz` or
+:meth:`~wordmill.node_types.AssemblySystem.to_edge_list`.
+"""
+from __future__ import annotations
+from collections import deque
+from typing import Dict, List, Type, Union
+
+from wordmill.node_types import Node, Inventory, Word, AssemblySystem
+
+# Directions in which edges are followed, see :func:`neighborhood`.
+DIRECTIONS = ('upstream', 'downstream', 'both')
+
+
+def neighborhood_nodes(
+        system: AssemblySystem,
+        center: Union[Node, Word],
+        hops: int,
+        direction: str = 'upstream',
+        cls: Type[Node] = Inventory
+) -> List[Node]:
+    """
+    Nodes within `hops` edges of a center node, in breadth-first order.
+
+    Args:
+        system: Assembly system.
+        center: Center node, or word whose nodes (filtered by `cls`) are the centers.
+        hops: Maximum number of edges between a center and the returned nodes.
+        direction: Follow input edges (``'upstream'``), output edges
+            (``'downstream'``) or both (``'both'``).
+        cls: Class of the center nodes if `center` is a word.
+
+    Returns:
+        List of nodes, starting with the centers.
+
+    Raises:
+        ValueError: If `hops` is negative, `direction` is unknown or no node of
+            class `cls` has the word `center`.
+    """
+    if hops < 0:
+        raise ValueError('Number of hops must not be negative.')
+    if direction not in DIRECTIONS:
+        raise ValueError('Unknown direction {}, choose from {}.'.format(direction, DIRECTIONS))
+    if isinstance(center, Node):
+        centers = [center]
+    else:
+        centers = system.nodes_with_word(center, cls)
+        if len(centers) == 0:
+            raise ValueError('No {} with word {!r} in the system.'.format(cls.__name__, center))
+    upstream = direction in ('upstream', 'both')
+    downstream = direction in ('downstream', 'both')
+    distance: Dict[Node, int] = {n: 0 for n in centers}
+    queue = deque(centers)
+    while len(queue) > 0:
+        n = queue.popleft()
+        if distance[n] == hops:
+            continue
+        neighbors = []
+        if upstream:
+            neighbors.extend(n.input_nodes)
+        if downstream:
+            neighbors.extend(n.output_nodes)
+        for m in neighbors:
+            if m not in distance:
+                distance[m] = distance[n] + 1
+                queue.append(m)
+    return list(distance)
+
+
+def neighborhood(
+        system: AssemblySystem,
+        center: Union[Node, Word],
+        hops: int,
+        direction: str = 'upstream',
+        cls: Type[Node] = Inventory
+) -> AssemblySystem:
+    """
+    Extract the neighborhood of a center node as a standalone assembly system, see
+    :func:`neighborhood_nodes` for the arguments.
+
+    Returns:
+        Copy of the nodes within `hops` edges of the center and the edges between them,
+        see :meth:`AssemblySystem.extract`.
+    """
+    return AssemblySystem.extract(neighborhood_nodes(system, center, hops, direction, cls))
@@ -1,7 +1,16 @@
 from __future__ import annotations
 import itertools
+import operator
 import sys
-from typing import List, Set, Type, Iterable, Optional, Tuple, Dict
+from collections import deque
+from typing import List, Set, Type, Iterable, Optional, Tuple, Dict, Sequence, Union, Callable, \
+    Iterator
+
+from wordmill.registry import get_generator
+
+# Words are either strings (every character is an atomic part) or tuples of integer token ids
+# (every token is an atomic part, see :mod:`wordmill.tokens`).
+Word = Union[str, Tuple[int, ...]]
 
 
 class Node:
@@ -19,55 +28,74 @@ class Node:
     allowed_input_node_class_names = set()
     allowed_output_node_class_names = set()
 
+    # Nodes are created in very large numbers by the generating algorithms. Use slots instead
+    # of a per-instance `__dict__` to reduce the memory footprint.
+    __slots__ = ('_id', '_inputs', '_outputs', '_input_nodes', '_output_nodes')
+
+    # Counter for the ids of nodes, see :attr:`Node.id`.
+    _ids = itertools.count()
+
     def __init__(self):
         """
         Constructor.
         """
-        # Variables can store necessary input and provided output words.
-        self._inputs = []
-        self._outputs = []
-        # List of input nodes
-        self._input_nodes = []
-        # List of output nodes
-        self._output_nodes = []
+        self._id = next(Node._ids)
+        # Variables can store necessary input and provided output words. Derived classes replace
+        # these by tuples. The empty tuple is shared among all instances.
+        self._inputs = ()
+        self._outputs = ()
+        # Input and output nodes. Lists are only allocated once the first edge is formed.
+        self._input_nodes = ()
+        self._output_nodes = ()
+
+    @property
+    def id(self) -> int:
+        """
+        Integer id assigned at creation. Ids increase in the order in which nodes are created,
+        so that nodes created by the same sequence of operations are ordered reproducibly.
+
+        Returns:
+            Id of the node.
+        """
+        return self._id
 
     @property
-    def inputs(self) -> List[str]:
+    def inputs(self) -> Tuple[Word, ...]:
         """
-        List of necessary input word(s)
+        Necessary input word(s)
 
         Returns:
-            List of necessary input word(s)
+            Tuple of necessary input word(s)
         """
         return self._inputs
 
     @property
-    def outputs(self) -> List[str]:
+    def outputs(self) -> Tuple[Word, ...]:
         """
-        List of necessary output word(s)
+        Provided output word(s)
 
         Returns:
-            List of necessary output word(s)
+            Tuple of provided output word(s)
         """
         return self._outputs
         
     @property
-    def output_nodes(self) -> List[Node]:
+    def output_nodes(self) -> Sequence[Node]:
         """
-        List of output nodes.
+        Sequence of output nodes.
 
         Returns:
-            List of output nodes.
+            Sequence of output nodes (an empty tuple if no outbound edge was formed yet).
         """
         return self._output_nodes
     
     @property
-    def input_nodes(self) -> List[Node]:
+    def input_nodes(self) -> Sequence[Node]:
         """
-        List of input nodes.
+        Sequence of input nodes.
 
         Returns:
-            List of input nodes.
+            Sequence of input nodes (an empty tuple if no inbound edge was formed yet).
         """
         return self._input_nodes
 
@@ -106,7 +134,10 @@ class Node:
                     self.allowed_output_node_class_names
                 )
             )
-        self._output_nodes.append(other_node)
+        if len(self._output_nodes) == 0:
+            self._output_nodes = [other_node]
+        else:
+            self._output_nodes.append(other_node)
 
     def form_inbound_edge(self, other_node: Node):
         """
@@ -135,11 +166,76 @@ class Node:
                     self.allowed_input_node_class_names
                 )
             )
-        self._input_nodes.append(other_node)
+        if len(self._input_nodes) == 0:
+            self._input_nodes = [other_node]
+        else:
+            self._input_nodes.append(other_node)
+
+    def remove_outbound_edge(self, other_node: Node):
+        """
+        Remove the link to a node that consumes an output of the current node.
+
+        Args:
+            other_node: Node to disconnect.
+
+        Raises:
+            ValueError: If there is no link to `other_node`.
+        """
+        if other_node not in self._output_nodes:
+            raise ValueError('other_node is not an output node')
+        self._output_nodes.remove(other_node)
+
+    def remove_inbound_edge(self, other_node: Node):
+        """
+        Remove the link to a node that provides an input of the current node.
+
+        Args:
+            other_node: Node to disconnect.
+
+        Raises:
+            ValueError: If there is no link to `other_node`.
+        """
+        if other_node not in self._input_nodes:
+            raise ValueError('other_node is not an input node')
+        self._input_nodes.remove(other_node)
+
+    def retain_edges(self, keep: Callable[[Node, Node], bool]):
+        """
+        Remove all edges of the node for which `keep` is false, in a single pass over the
+        adjacency lists. Removing many edges of a node with many neighbors this way takes
+        linear instead of quadratic time (compare :func:`remove_edge`).
+
+        Args:
+            keep: Binary predicate called with the source and sink node of every edge.
+
+        Note:
+            Only the adjacency lists of this node are modified. Call this method for the
+            other nodes of the removed edges as well to keep the edges symmetric.
+        """
+        inputs = [i for i in self._input_nodes if keep(i, self)]
+        outputs = [o for o in self._output_nodes if keep(self, o)]
+        self._input_nodes = inputs if len(inputs) > 0 else ()
+        self._output_nodes = outputs if len(outputs) > 0 else ()
 
     @property
-    def word(self) -> str:
+    def word(self) -> Word:
         return self._outputs[0]
+
+    def copy(self) -> Node:
+        """
+        Create a copy of the node that provides and consumes the same words, but is
+        not connected to any other node.
+
+        Returns:
+            Unconnected copy.
+        """
+        return self.__class__(*(self._inputs if len(self._inputs) > 0 else self._outputs))
+
+    def __repr__(self) -> str:
+        return '{}({})'.format(
+            self.__class__.__name__,
+            ', '.join(repr(w) for w in (self._inputs if len(self._inputs) > 0 else self._outputs))
+        )
         
     @property
     def fully_connected(self) -> bool:
@@ -165,7 +261,7 @@ class Node:
         return True
 
     @staticmethod
-    def split_word(word: str, pos: int) -> Tuple[str, str]:
+    def split_word(word: Word, pos: int) -> Tuple[Word, Word]:
         """
         Helper method to split a string at position `pos`, returning both substrings.
         The length of the first substring will be `pos` characters.
@@ -188,6 +284,67 @@ class Node:
         assert 1 <= pos <= len(word) - 1, 'Parameter pos out of valid range.'
         return word[:pos], word[pos:]
 
+    @staticmethod
+    def find_word(word: Word, sub_word: Word) -> int:
+        """
+        Helper method to find the first occurrence of `sub_word` within `word`.
+        In contrast to the `in` operator and :meth:`tuple.index`, this works
+        on contiguous subsequences of token words as well.
+
+        Args:
+            word: Word to search in.
+            sub_word: Word to search for.
+
+        Returns:
+            Position of the first occurrence, -1 if `sub_word` is not contained
+            in `word`.
+        """
+        if isinstance(word, str):
+            return word.find(sub_word)
+        n = len(sub_word)
+        if n == 0:
+            return 0
+        first = sub_word[0]
+        pos = 0
+        try:
+            while True:
+                pos = word.index(first, pos, len(word) - n + 1)
+                if word[pos:pos + n] == sub_word:
+                    return pos
+                pos += 1
+        except ValueError:
+            return -1
+
+    @staticmethod
+    def atoms(word: Word) -> List[Word]:
+        """
+        Helper method to decompose a word into its atomic parts (single
+        characters of string words, 1-tuples of token words).
+
+        Args:
+            word: Input word.
+
+        Returns:
+            List of atomic parts.
+        """
+        return [word[i:i + 1] for i in range(len(word))]
+
+    @staticmethod
+    def format_word(word: Word) -> str:
+        """
+        Helper method to obtain a printable representation of a word. Token words
+        are represented by their space separated token ids.
+
+        Args:
+            word: Input word.
+
+        Returns:
+            Printable representation.
+        """
+        if isinstance(word, str):
+            return word
+        return ' '.join(str(t) for t in word)
+
 
 class Inventory(Node):
     """
@@ -196,8 +353,9 @@ class Inventory(Node):
     """
     allowed_input_node_class_names = {'Source', 'Machine'}
     allowed_output_node_class_names = {'Sink', 'Machine'}
+    __slots__ = ()
 
-    def __init__(self, word: str):
+    def __init__(self, word: Word):
         """
         Constructor.
 
@@ -205,8 +363,8 @@ class Inventory(Node):
             word: Word to store.
         """
         Node.__init__(self)
-        self._inputs = tuple([word])
-        self._outputs = tuple([word])
+        # Input and output word are identical, share a single tuple.
+        self._inputs = self._outputs = (word,)
 
 
 class Machine(Node):
@@ -219,8 +377,9 @@ class Machine(Node):
     """
     allowed_input_node_class_names = {'Inventory'}
     allowed_output_node_class_names = {'Inventory'}
+    __slots__ = ()
 
-    def __init__(self, left_word: str, right_word: str):
+    def __init__(self, left_word: Word, right_word: Word):
         """
         Constructor
 
@@ -229,15 +388,16 @@ class Machine(Node):
             right_word: "right" input word
         """
         Node.__init__(self)
-        self._inputs = tuple([left_word, right_word])
-        self._outputs = tuple([left_word + right_word])
+        self._inputs = (left_word, right_word)
+        self._outputs = (left_word + right_word,)
 
 
 class Source(Node):
     allowed_input_node_class_names = set()
     allowed_output_node_class_names = {'Inventory'}
+    __slots__ = ()
 
-    def __init__(self, word: str):
+    def __init__(self, word: Word):
         """
         Constructor.
 
@@ -245,14 +405,15 @@ class Source(Node):
             word: Word provided by this source.
         """
         Node.__init__(self)
-        self._outputs = tuple([word])
+        self._outputs = (word,)
 
 
 class Sink(Node):
     allowed_input_node_class_names = {'Inventory'}
     allowed_output_node_class_names = set()
+    __slots__ = ()
 
-    def __init__(self, word: str):
+    def __init__(self, word: Word):
         """
         Constructor
 
@@ -260,10 +421,10 @@ class Sink(Node):
             word: Input word consumed by this sink.
         """
         Node.__init__(self)
-        self._inputs = tuple([word])
+        self._inputs = (word,)
     
     @property
-    def word(self) -> str:
+    def word(self) -> Word:
         """
         Return word consumed by this node type.
 
@@ -273,6 +434,10 @@ class Sink(Node):
         return self._inputs[0]
 
 
+# Sort key of nodes in order of creation, reads the slot to avoid the property call.
+_node_id = operator.attrgetter('_id')
+
+
 class AssemblySystem:
     """
     An AssemblySystem instance is a directed graph of :class:`Node` instances
@@ -280,12 +445,14 @@ class AssemblySystem:
     of output words (consumed by :class:`Sink` instances), using
     :class:`Machine` and :class:`Inventory` instances.
     """
-    def __init__(self, nodes: Optional[Set[Node]] = None):
+    def __init__(self, nodes: Optional[Iterable[Node]] = None):
         """
         Constructor.
 
         Args:
-            nodes: Set of nodes that constitute this assembly network.
+            nodes: Nodes that constitute this assembly network. They are stored in the
+                order of their ids (see :attr:`Node.id`), such that iterating over the
+                nodes, traversals and exports are reproducible.
 
         Note:
             Calling the constructor directly is not the recommended way of
@@ -298,9 +465,128 @@ class AssemblySystem:
             system "from scratch".
         """
         if nodes is None:
-            nodes = set()
-        self._nodes = nodes
-       
+            nodes = ()
+        # Insertion-ordered dictionary used as an ordered set
+        self._nodes: Dict[Node, None] = dict.fromkeys(sorted(nodes, key=_node_id))
+        # Topological order is computed lazily and cached, see
+        # :attr:`AssemblySystem.topological_order`.
+        self._topological_order: Optional[List[Node]] = None
+        # Index from words to the nodes that provide or consume them, built lazily, see
+        # :meth:`AssemblySystem.nodes_with_word`.
+        self._word_index: Optional[Dict[Word, List[Node]]] = None
+
+    @property
+    def topological_order(self) -> List[Node]:
+        """
+        All nodes of the system in topological order, i.e. every node is listed
+        after all of its input nodes.
+
+        The order is computed once (Kahn's algorithm, linear in the number of
+        nodes and edges) and cached on the instance, so that repeated analyses
+        (see :mod:`wordmill.analysis`) do not need to traverse the graph again.
+
+        Returns:
+            List of nodes in topological order.
+
+        Note:
+            The cache assumes that the edges between the nodes of the system are
+            not modified after the order has been computed. Call
+            :meth:`AssemblySystem.invalidate_caches` after modifying edges.
+
+        Raises:
+            ValueError: If the system contains a cycle.
+        """
+        if self._topological_order is None:
+            in_degree = {n: len(n.input_nodes) for n in self._nodes}
+            ready = deque(n for n, d in in_degree.items() if d == 0)
+            order = []
+            while len(ready) > 0:
+                n = ready.popleft()
+                order.append(n)
+                for successor in n.output_nodes:
+                    in_degree[successor] -= 1
+                    if in_degree[successor] == 0:
+                        ready.append(successor)
+            if len(order) != len(self._nodes):
+                raise ValueError('Assembly system contains a cycle.')
+            self._topological_order = order
+        return self._topological_order
+
+    def invalidate_caches(self):
+        """
+        Drop all cached information derived from the structure of the system.
+        Has to be called if edges between nodes are added or removed after
+        the system was created.
+        """
+        self._topological_order = None
+        self._word_index = None
+
+    def remove_nodes(self, nodes: Iterable[Node]):
+        """
+        Remove nodes from the system, together with all edges between them and the
+        remaining nodes. The removed nodes keep the edges among each other.
+
+        Args:
+            nodes: Nodes to remove.
+        """
+        removed = set(nodes)
+
+        def keep(source: Node, sink: Node) -> bool:
+            return source not in removed and sink not in removed
+
+        # Every remaining neighbor is filtered once, see Node.retain_edges
+        neighbors = dict.fromkeys(
+            m for n in removed for m in itertools.chain(n.input_nodes, n.output_nodes)
+            if m not in removed
+        )
+        for m in neighbors:
+            m.retain_edges(keep)
+        for n in removed:
+            self._nodes.pop(n, None)
+        self.invalidate_caches()
+
+    def nodes_with_word(self, word: Word, cls: Type[Node] = Node) -> List[Node]:
+        """
+        Look up the nodes of the system whose word (see :attr:`Node.word`) is `word`.
+
+        The index from words to nodes is built once (linear in the number of nodes)
+        and cached on the instance, subsequent look-ups take constant time.
+
+        Args:
+            word: Word to look up.
+            cls: Class by which to filter.
+
+        Returns:
+            All nodes in the system with the given word that are a subclass of `cls`.
+        """
+        if self._word_index is None:
+            index: Dict[Word, List[Node]] = {}
+            for n in self._nodes:
+                index.setdefault(n.word, []).append(n)
+            self._word_index = index
+        return [n for n in self._word_index.get(word, ()) if isinstance(n, cls)]
+
+    @classmethod
+    def extract(cls, nodes: Iterable[Node]) -> AssemblySystem:
+        """
+        Create a standalone copy of a part of an assembly system. All `nodes` are
+        copied (see :meth:`Node.copy`) and connected by the edges between them,
+        edges to other nodes are dropped.
+
+        Args:
+            nodes: Nodes of the system to copy.
+
+        Returns:
+            Assembly system made of the copies. Note that nodes at its boundary are
+            typically not fully connected.
+        """
+        copies = {n: n.copy() for n in sorted(nodes, key=_node_id)}
+        for n, c in copies.items():
+            for o in n.output_nodes:
+                if o in copies:
+                    form_edge(c, copies[o])
+        return cls(copies.values())
+
     def get_nodes_of_type(self, cls: Type[Node]) -> List[Node]:
         """
         Get all nodes of a given class that are part of the system.
@@ -311,6 +597,8 @@ class AssemblySystem:
         Returns:
             All nodes in the system that are a subclass of `cls`.
         """
+        if cls is Node:
+            return list(self._nodes)
         return [
             n
             for n in self._nodes
@@ -318,7 +606,7 @@ class AssemblySystem:
         ]
 
     @classmethod
-    def discover(cls, subset: Iterable[Node]) -> AssemblySystem:
+    def discover(cls, subset: Iterable[Node], check_coverage: bool = True) -> AssemblySystem:
         """
         Automatically discover a full assembly system by following connections
         between :class:`Node` instances.
@@ -326,6 +614,9 @@ class AssemblySystem:
         Args:
             subset: Subset of :class:`Node` instances that are part of the
                 assembly network. E.g. all sources or sinks.
+            check_coverage: Check that every discovered node is sufficiently
+                connected. Can be disabled for intermediate systems that are
+                checked later on (e.g. shards, see :mod:`wordmill.sharding`).
 
         Returns:
             AssemblySystem instance generated from the discovered nodes.
@@ -339,24 +630,43 @@ class AssemblySystem:
             the set of sources or sinks (or both).
 
         Raises:
-            ValueError: If one of the discovered nodes is insufficiently
-                connected to input/output nodes.
-        """
-        untreated_nodes = set(subset)
-        discovered_nodes = set()
+            ValueError: If `check_coverage` is true and one of the discovered
+                nodes is insufficiently connected to input/output nodes. The
+                message contains the diagnostics of
+                :func:`wordmill.validation.check_coverage`.
+        """
+        # Breadth-first search in the order of the edges, the dictionary keeps the order of
+        # discovery.
+        discovered_nodes = dict.fromkeys(subset)
+        untreated_nodes = deque(discovered_nodes)
         while len(untreated_nodes) > 0:
-            n = untreated_nodes.pop()
-            untreated_nodes |= (n.neighbors - discovered_nodes)
-            discovered_nodes.add(n)
-        if not all([n.fully_connected for n in discovered_nodes]):
-            raise ValueError('Found node with insufficient inbound/outbound edges.')
+            n = untreated_nodes.popleft()
+            for m in n._input_nodes:
+                if m not in discovered_nodes:
+                    discovered_nodes[m] = None
+                    untreated_nodes.append(m)
+            for m in n._output_nodes:
+                if m not in discovered_nodes:
+                    discovered_nodes[m] = None
+                    untreated_nodes.append(m)
+        if not check_coverage:
+            return AssemblySystem(discovered_nodes)
+        # Import here to avoid a circular import, the validation module builds on the node types.
+        # Type and word rules are enforced by form_edge, only coverage has to be checked.
+        from wordmill.validation import check_coverage
+        report = check_coverage(list(discovered_nodes))
+        if not report.valid:
+            raise ValueError(
+                'Found node with insufficient inbound/outbound edges.\n{}'.format(report)
+            )
         return AssemblySystem(discovered_nodes)
 
     @classmethod
     def generate(
             cls,
-            func,
-            *words: str,
+            func: Union[str, Callable],
+            *words: Word,
+            memory_budget: Optional[int] = None,
             **kwargs
     ) -> AssemblySystem:
         """
@@ -364,26 +674,135 @@ class AssemblySystem:
         generating function.
 
         Args:
-            func: Generating function, as provided in :module:`wordmill.algorithms`
+            func: Generating function, as provided in :module:`wordmill.algorithms`,
+                or the name under which it is registered in :mod:`wordmill.registry`.
             words: Any other unnamed parameters are assumed to be strings
                 indicating the output words.
+            memory_budget: Maximum memory footprint of the system in bytes. If
+                given, the size of the system is estimated before any node is
+                created (requires a registered generating function).
             kwargs: Any other named arguments are passed as additional arguments
                 to `func`.
 
         Note:
             In this function, it is assumed that the assembly system is to build
-            from atomic inputs (single characters).
+            from atomic inputs (single characters of string words or single tokens
+            of token words, see :meth:`Node.atoms`).
+
+        Raises:
+            ValueError: If the estimated memory footprint exceeds `memory_budget`
+                or if `func` is not registered but a budget is given.
+        """
+        info = get_generator(func)
+        if info is not None:
+            func = info.func
+            info.check_budget(words, memory_budget, **kwargs)
+        elif memory_budget is not None:
+            raise ValueError(
+                'Memory budget can only be checked for registered generating functions.'
+            )
+        return cls.generate_from_iterable(func, words, **kwargs)
+
+    @classmethod
+    def generate_chunks(
+            cls,
+            func: Union[str, Callable],
+            *words: Word,
+            memory_budget: int,
+            **kwargs
+    ) -> Iterator[AssemblySystem]:
         """
-        sinks = {
-            w: Sink(w)
-            for w in words
-        }
-        sources = {
-            inp: Source(inp)
-            for inp in set(itertools.chain(*words))
-        }
-        func(sources, sinks, **kwargs)
-        return cls.discover(sources.values())
+        Generate the assembly system for a set of output words in chunks of words,
+        such that the system for every chunk fits into a memory budget. Only
+        available for generating functions that are registered as `streaming`,
+        i.e. for which the union of the chunks equals the full system (apart
+        from sources, which are created once per chunk).
+
+        Args:
+            func: Registered generating function or its name.
+            words: Output words.
+            memory_budget: Maximum memory footprint per chunk in bytes.
+            kwargs: Any other named arguments are passed as additional arguments
+                to `func`.
+
+        Returns:
+            Iterator over assembly systems, one per chunk.
+
+        Raises:
+            ValueError: If `func` does not support streaming or the system for a
+                single word exceeds the budget.
+        """
+        info = get_generator(func)
+        if info is None or not info.streaming:
+            raise ValueError('Generating function does not support generation in chunks.')
+        chunk = []
+        chunk_memory = 0
+        for w in words:
+            word_memory = info.estimate_size([w], **kwargs).memory
+            if word_memory > memory_budget:
+                info.check_budget([w], memory_budget, **kwargs)
+            if chunk_memory + word_memory > memory_budget:
+                yield cls.generate(info.func, *chunk, **kwargs)
+                chunk = []
+                chunk_memory = 0
+            chunk.append(w)
+            chunk_memory += word_memory
+        if len(chunk) > 0:
+            yield cls.generate(info.func, *chunk, **kwargs)
+
+    @classmethod
+    def generate_from_iterable(
+            cls,
+            func: Union[str, Callable],
+            words: Iterable[Word],
+            chunk_size: int = 100000,
+            check_coverage: bool = True,
+            **kwargs
+    ) -> AssemblySystem:
+        """
+        Generate an AssemblySystem from an iterable of output words (e.g. as read by
+        :mod:`wordmill.ingestion`) without materialising the words first.
+
+        Duplicate words are skipped and sources are created incrementally for the
+        atomic parts of every new word. If `func` is registered as `streaming`, it
+        is called once per chunk of `chunk_size` new words, otherwise once for all
+        words.
+
+        Args:
+            func: Generating function or the name under which it is registered.
+            words: Iterable of output words.
+            chunk_size: Number of output words per call of `func`.
+            check_coverage: Check the generated system, see :meth:`discover`.
+            kwargs: Any other named arguments are passed as additional arguments
+                to `func`.
+
+        Returns:
+            Generated assembly system.
+        """
+        info = get_generator(func)
+        streaming = info is not None and info.streaming
+        if info is not None:
+            func = info.func
+        sources: Dict[Word, Node] = {}
+        sinks: Dict[Word, Node] = {}
+        chunk: Dict[Word, Node] = {}
+        for w in words:
+            if w in sinks:
+                continue
+            sinks[w] = Sink(w)
+            for inp in Node.atoms(w):
+                if inp not in sources:
+                    sources[inp] = Source(inp)
+            if streaming:
+                chunk[w] = sinks[w]
+                if len(chunk) >= chunk_size:
+                    func(sources, chunk, **kwargs)
+                    chunk = {}
+        if not streaming:
+            func(sources, sinks, **kwargs)
+        elif len(chunk) > 0:
+            func(sources, chunk, **kwargs)
+        return cls.discover(sources.values(), check_coverage)
     
     def to_digraph(self) -> 'networkx.MultiDiGraph':
         """
@@ -395,6 +814,7 @@ class AssemblySystem:
         """
         import networkx as nx
         g = nx.MultiDiGraph()
+        g.add_nodes_from(self._nodes)
         for n in self._nodes:
             for sink in n.output_nodes:
                 g.add_edge(n, sink)
@@ -405,6 +825,10 @@ class AssemblySystem:
         Return string representation that can be rendered using
         `GraphViz <https://www.graphviz.org/>`_.
 
+        Nodes are numbered in the order in which they are stored (see
+        :meth:`AssemblySystem.__init__`), so the output is identical for systems created by
+        the same sequence of operations.
+
         Returns:
             GraphViz String representation.
         """
@@ -414,13 +838,15 @@ class AssemblySystem:
             Sink: 'trapezium',
             Source: 'invtrapezium'
         }
-        node_dict: Dict[str, Node] = {str(i): n for i, n in enumerate(self._nodes)}
+        node_dict: Dict[str, Node] = {str(i): n for n, i in self._node_keys().items()}
         s = 'digraph wordmill {\n'
         for key, n in node_dict.items():
             s += '\t"{}" [shape={}, label="{}"];\n'.format(
                 key,
-                class_to_shape[n.__class__],
-                n.word if not isinstance(n, Machine) else '+'.join(n.inputs)
+                # Derived classes are rendered like their closest listed base class
+                next(class_to_shape[c] for c in n.__class__.__mro__ if c in class_to_shape),
+                Node.format_word(n.word) if not isinstance(n, Machine)
+                else '+'.join(Node.format_word(w) for w in n.inputs)
             )
         invert_node_dict = {v: k for k, v in node_dict.items()}
         for key, source in node_dict.items():
@@ -429,17 +855,62 @@ class AssemblySystem:
         s += '}'
         return s
 
+    def _node_keys(self) -> Dict[Node, int]:
+        """
+        Integer keys of the nodes used by the exports of the system (positions in the
+        ordered node storage).
+        """
+        return {n: i for i, n in enumerate(self._nodes)}
+
+    def to_edge_list(self) -> List[Tuple[int, int]]:
+        """
+        Return the edges of the system as pairs of integer node keys. The keys are
+        the same as those of the nodes in :meth:`AssemblySystem.to_graphviz`.
+
+        Returns:
+            List of (source key, sink key) pairs.
+        """
+        keys = self._node_keys()
+        return [(keys[n], keys[o]) for n in keys for o in n.output_nodes]
+
 
-def form_edge(source: Node, sink: Node):
+def form_edge(source: Node, sink: Node, check: bool = True):
     """
     Helper function that registers an edge with both the the source and sink nodes.
     Edge validation (that source and sink share an exchangeable product and are of correct type)
     is checked by the called functions :meth:`Node.form_outbound_edge` and :meth:`form_inbound_edge`
     respectively.
 
+    Args:
+        source: Origin of edge.
+        sink: Destination of edge.
+        check: Validate the edge. Only disable this for edges copied from a system
+            whose edges were validated already (e.g. when merging shards, see
+            :mod:`wordmill.sharding`).
+    """
+    if check:
+        source.form_outbound_edge(sink)
+        sink.form_inbound_edge(source)
+        return
+    # Same lazy allocation of the adjacency lists as in Node.form_outbound_edge
+    if len(source._output_nodes) == 0:
+        source._output_nodes = [sink]
+    else:
+        source._output_nodes.append(sink)
+    if len(sink._input_nodes) == 0:
+        sink._input_nodes = [source]
+    else:
+        sink._input_nodes.append(source)
+
+
+def remove_edge(source: Node, sink: Node):
+    """
+    Helper function that removes an edge from both the source and sink nodes. Counterpart of
+    :func:`form_edge`.
+
     Args:
         source: Origin of edge.
         sink: Destination of edge.
     """
-    source.form_outbound_edge(sink)
-    sink.form_inbound_edge(source)
+    source.remove_outbound_edge(sink)
+    sink.remove_inbound_edge(source)
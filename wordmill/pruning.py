@@ -0,0 +1,108 @@
+"""
+Pruning of assembly systems with alternative machines per inventory.
+
+Generating functions such as
+:func:`~wordmill.algorithms.form_bio_inspired_assembly` connect every inventory
+to one machine per split position of its word. :func:`prune_splits` keeps only
+the `k` best of these alternatives per inventory and removes all machines,
+inventories and sources that are no longer needed to supply a sink.
+"""
+from __future__ import annotations
+from typing import Dict, Set, Tuple
+
+from wordmill.node_types import Node, Inventory, Machine, Sink, AssemblySystem
+
+# Available strategies to rank alternative machines, see :func:`prune_splits`.
+STRATEGIES = ('reuse', 'depth')
+
+
+def _depths(system: AssemblySystem) -> Dict[Node, int]:
+    """
+    Minimum number of machines needed to produce the output of every node. Inventories need one
+    of their suppliers, machines need all of their inputs.
+    """
+    depth: Dict[Node, int] = {}
+    for n in system.topological_order:
+        if len(n.input_nodes) == 0:
+            depth[n] = 0
+        elif isinstance(n, Machine):
+            depth[n] = 1 + max(depth[i] for i in n.input_nodes)
+        else:
+            depth[n] = min(depth[i] for i in n.input_nodes)
+    return depth
+
+
+def _balance(m: Machine) -> int:
+    left, right = m.inputs[0], m.inputs[-1]
+    return abs(len(left) - len(right))
+
+
+def prune_splits(system: AssemblySystem, k: int, strategy: str = 'reuse') -> AssemblySystem:
+    """
+    Keep at most `k` supplying machines per inventory and remove all nodes that are
+    no longer needed.
+
+    Inventories are processed from the sinks upstream. The alternatives for an
+    inventory are ranked according to `strategy`:
+
+    * ``'reuse'``: Prefer machines whose input inventories are already needed by
+      machines kept so far, such that as few additional inventories as possible
+      are needed.
+    * ``'depth'``: Prefer machines that need the smallest number of consecutive
+      processing steps to be supplied (shortest lead time).
+
+    Remaining ties are broken in favour of balanced splits, then of the other
+    strategy.
+
+    The system is pruned in place: edges of its nodes are removed and nodes that are
+    no longer needed are removed from the system (see
+    :meth:`AssemblySystem.remove_nodes`). To keep the original system, prune a copy
+    created by :meth:`AssemblySystem.extract` instead.
+
+    Args:
+        system: Assembly system to prune.
+        k: Maximum number of supplying machines per inventory.
+        strategy: Ranking strategy, one of :data:`STRATEGIES`.
+
+    Returns:
+        The same (pruned) assembly system. Every node still satisfies the connectivity
+        rules checked by :meth:`AssemblySystem.discover`.
+
+    Raises:
+        ValueError: If `k` is smaller than one or `strategy` is unknown.
+    """
+    if k < 1:
+        raise ValueError('At least one machine per inventory has to be kept.')
+    if strategy not in STRATEGIES:
+        raise ValueError('Unknown strategy {}, choose from {}.'.format(strategy, STRATEGIES))
+    order = system.topological_order
+    depth = _depths(system)
+    sinks = [n for n in order if isinstance(n, Sink)]
+    kept: Set[Node] = set(sinks)
+    # Edges from alternatives that are not kept. Edges are removed in one pass at the end, as
+    # removing them one by one is quadratic in the degree of inventories with many consumers.
+    dropped: Set[Tuple[Node, Node]] = set()
+    for n in reversed(order):
+        if n not in kept:
+            continue
+        suppliers = n.input_nodes
+        if isinstance(n, Inventory) and len(suppliers) > k:
+            def reuse(m: Node) -> int:
+                return -sum(1 for i in m.input_nodes if i in kept)
+
+            if strategy == 'reuse':
+                ranking = sorted(suppliers, key=lambda m: (reuse(m), _balance(m), depth[m]))
+            else:
+                ranking = sorted(suppliers, key=lambda m: (depth[m], _balance(m), reuse(m)))
+            dropped.update((m, n) for m in ranking[k:])
+            suppliers = ranking[:k]
+        kept.update(suppliers)
+    # Detach all nodes that are not needed anymore and remove them from the system
+
+    def keep(source: Node, sink: Node) -> bool:
+        return source in kept and sink in kept and (source, sink) not in dropped
+
+    for n in order:
+        n.retain_edges(keep)
+    system.remove_nodes([n for n in order if n not in kept])
+    return system
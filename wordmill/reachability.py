@@ -0,0 +1,195 @@
+"""
+Precomputed reachability between the nodes of an assembly system and its
+sources and sinks.
+
+The index stores, for every node, the set of sinks downstream and the set of
+sources upstream of the node as bitsets (Python integers). Both are computed in
+one pass each over the topological order of the system. Bitsets with identical
+values are stored only once, which compresses the index considerably for large
+systems, where long chains of nodes feed the same sinks.
+
+Membership queries are single bit tests on the bitsets. List queries take time
+linear in the size of the answer plus the number of 64-bit words of the bitset
+(i.e. the number of sinks or sources divided by 64).
+"""
+from __future__ import annotations
+import sys
+from array import array
+from typing import Dict, Iterable, List, Sequence
+
+from wordmill.node_types import Node, Source, Sink, AssemblySystem
+
+
+def _bits(bitset: int) -> Iterable[int]:
+    """
+    Positions of the set bits of an integer, in ascending order.
+
+    The integer is converted to 64-bit words once, and set bits are decoded from these words,
+    so that the big integer is not copied for every set bit. Decoding takes time linear in the
+    number of set bits plus the number of 64-bit words. The words are always written in
+    little-endian order, so that word `k` holds bits `64 * k` to `64 * k + 63`, and swapped to
+    the native byte order on big-endian hosts.
+    """
+    if bitset == 0:
+        return
+    n_words = (bitset.bit_length() + 63) // 64
+    words = array('Q', bitset.to_bytes(8 * n_words, 'little'))
+    if sys.byteorder == 'big':
+        words.byteswap()
+    for k, word in enumerate(words):
+        base = 64 * k
+        while word:
+            low = word & -word
+            yield base + low.bit_length() - 1
+            word ^= low
+
+
+class ReachabilityIndex:
+    """
+    Transitive closure of an assembly system with respect to its sources and sinks.
+    """
+    def __init__(self, system: AssemblySystem):
+        """
+        Constructor. Builds the index in time linear in the number of edges times the
+        number of machine words needed to hold the bitsets.
+
+        Args:
+            system: Assembly system to index.
+        """
+        order = system.topological_order
+        self._sinks: List[Sink] = [n for n in order if isinstance(n, Sink)]
+        self._sources: List[Source] = [n for n in order if isinstance(n, Source)]
+        # Identical bitsets are shared among nodes
+        interned: Dict[int, int] = {}
+        sink_bits = {s: 1 << i for i, s in enumerate(self._sinks)}
+        self._downstream: Dict[Node, int] = {}
+        for n in reversed(order):
+            bitset = sink_bits.get(n, 0)
+            for o in n.output_nodes:
+                bitset |= self._downstream[o]
+            self._downstream[n] = interned.setdefault(bitset, bitset)
+        source_bits = {s: 1 << i for i, s in enumerate(self._sources)}
+        self._upstream: Dict[Node, int] = {}
+        for n in order:
+            bitset = source_bits.get(n, 0)
+            for i in n.input_nodes:
+                bitset |= self._upstream[i]
+            self._upstream[n] = interned.setdefault(bitset, bitset)
+        self._n_distinct_bitsets = len(interned)
+        self._sink_index = {s: i for i, s in enumerate(self._sinks)}
+        self._source_index = {s: i for i, s in enumerate(self._sources)}
+
+    def sinks_affected_by(self, node: Node) -> List[Sink]:
+        """
+        Sinks that depend on a node, i.e. that are downstream of it.
+
+        Args:
+            node: Node of the system.
+
+        Returns:
+            List of sinks.
+        """
+        return [self._sinks[i] for i in _bits(self._downstream[node])]
+
+    def sources_feeding(self, node: Node) -> List[Source]:
+        """
+        Sources that feed a node, i.e. that are upstream of it.
+
+        Args:
+            node: Node of the system.
+
+        Returns:
+            List of sources.
+        """
+        return [self._sources[i] for i in _bits(self._upstream[node])]
+
+    def depends_on(self, sink: Sink, node: Node) -> bool:
+        """
+        Binary predicate indicating if `node` is upstream of `sink`.
+
+        Args:
+            sink: Sink of the system.
+            node: Node of the system.
+
+        Returns:
+            Binary predicate.
+        """
+        return bool(self._downstream[node] >> self._sink_index[sink] & 1)
+
+    def is_fed_by(self, node: Node, source: Source) -> bool:
+        """
+        Binary predicate indicating if `source` is upstream of `node`.
+
+        Args:
+            node: Node of the system.
+            source: Source of the system.
+
+        Returns:
+            Binary predicate.
+        """
+        return bool(self._upstream[node] >> self._source_index[source] & 1)
+
+    def sinks_affected_by_any(self, nodes: Iterable[Node]) -> List[Sink]:
+        """
+        Sinks that depend on at least one of several nodes (e.g. all machines that
+        go down at the same time).
+
+        Args:
+            nodes: Nodes of the system.
+
+        Returns:
+            List of sinks.
+        """
+        bitset = 0
+        for n in nodes:
+            bitset |= self._downstream[n]
+        return [self._sinks[i] for i in _bits(bitset)]
+
+    def sources_feeding_any(self, nodes: Iterable[Node]) -> List[Source]:
+        """
+        Sources that feed at least one of several nodes.
+
+        Args:
+            nodes: Nodes of the system.
+
+        Returns:
+            List of sources.
+        """
+        bitset = 0
+        for n in nodes:
+            bitset |= self._upstream[n]
+        return [self._sources[i] for i in _bits(bitset)]
+
+    def sinks_affected_by_each(self, nodes: Sequence[Node]) -> Dict[Node, List[Sink]]:
+        """
+        Batched version of :meth:`sinks_affected_by`.
+
+        Args:
+            nodes: Nodes of the system.
+
+        Returns:
+            Dictionary, keyed by nodes, holding the lists of affected sinks.
+        """
+        return {n: self.sinks_affected_by(n) for n in nodes}
+
+    def sources_feeding_each(self, nodes: Sequence[Node]) -> Dict[Node, List[Source]]:
+        """
+        Batched version of :meth:`sources_feeding`.
+
+        Args:
+            nodes: Nodes of the system.
+
+        Returns:
+            Dictionary, keyed by nodes, holding the lists of feeding sources.
+        """
+        return {n: self.sources_feeding(n) for n in nodes}
+
+    @property
+    def n_distinct_bitsets(self) -> int:
+        """
+        Number of distinct bitsets stored in the index (a measure of its size).
+
+        Returns:
+            Number of distinct bitsets.
+        """
+        return self._n_distinct_bitsets
@@ -0,0 +1,326 @@
+"""
+Registry of generating functions (see :mod:`wordmill.algorithms`).
+
+Every generating function registers metadata that allows
+:meth:`AssemblySystem.generate <wordmill.node_types.AssemblySystem.generate>` to
+check a request before any node is created:
+
+* an estimate of the number of nodes and edges that will be created for a given
+  set of output words,
+* whether words can be processed independently of each other (`streaming`),
+  i.e. generating chunks of words separately results in the same nodes,
+* a key that identifies intermediate inventories and machines shared between
+  several output words (`share_key`). Nodes with equal keys created in separate
+  runs of the function (e.g. for different shards of words, see
+  :mod:`wordmill.sharding`) are identical including all of their input nodes.
+"""
+from __future__ import annotations
+import functools
+import sys
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+# Bytes per node for the entry in the node storage of the assembly system (insertion-ordered
+# dictionary including over-allocation) and in the lists built while generating.
+BYTES_PER_STORAGE_ENTRY = 64
+# Bytes per edge: one reference in the output list of its origin and one in the input list of
+# its destination, including over-allocation of the lists.
+BYTES_PER_EDGE = 24
+# Ratio of the peak to the retained memory during generation. The peak is reached while
+# :meth:`AssemblySystem.discover <wordmill.node_types.AssemblySystem.discover>` validates the
+# system, as validation holds a flat copy of all nodes and edges. Calibrated with `tracemalloc`
+# on systems created by the generating functions, see `benchmarks/memory_per_node.py`.
+PEAK_FACTOR = 2.0
+
+
+@functools.lru_cache(maxsize=None)
+def bytes_per_node() -> int:
+    """
+    Retained memory per node in bytes, excluding the contents of its words (see
+    :attr:`SizeEstimate.word_bytes`) and its edges. Computed from the memory layout of a
+    :class:`~wordmill.node_types.Machine`, the largest node class: the instance with its slots,
+    its id, two adjacency lists, the tuples of input and output words and three word objects.
+
+    Returns:
+        Bytes per node.
+    """
+    # Import here to avoid a circular import, the node types look up generating functions.
+    from wordmill.node_types import Machine
+    m = Machine('a', 'b')
+    return (
+        sys.getsizeof(m)
+        + sys.getsizeof(1 << 30)
+        + 2 * sys.getsizeof([m])
+        + sys.getsizeof(m.inputs) + sys.getsizeof(m.outputs)
+        + 3 * sys.getsizeof('')
+        + BYTES_PER_STORAGE_ENTRY
+    )
+
+
+class SizeEstimate(NamedTuple):
+    """
+    Estimated (upper bound of the) size of an assembly system.
+    """
+    #: Number of nodes.
+    nodes: int
+    #: Number of edges.
+    edges: int
+    #: Bytes needed for the contents (characters or tokens) of all words held by the nodes.
+    word_bytes: int = 0
+
+    @property
+    def retained_memory(self) -> int:
+        """
+        Estimated memory footprint in bytes of the generated system.
+
+        Returns:
+            Memory footprint.
+        """
+        return self.nodes * bytes_per_node() + self.edges * BYTES_PER_EDGE + self.word_bytes
+
+    @property
+    def memory(self) -> int:
+        """
+        Estimated peak memory footprint in bytes while the system is generated, see
+        :data:`PEAK_FACTOR`. This is the value checked against memory budgets.
+
+        Returns:
+            Memory footprint.
+        """
+        return int(self.retained_memory * PEAK_FACTOR)
+
+    def __add__(self, other: SizeEstimate) -> SizeEstimate:
+        return SizeEstimate(
+            self.nodes + other.nodes,
+            self.edges + other.edges,
+            self.word_bytes + other.word_bytes
+        )
+
+
+class GeneratorInfo:
+    """
+    Metadata of a registered generating function.
+    """
+    def __init__(
+            self,
+            func: Callable,
+            name: str,
+            estimate: Callable[..., SizeEstimate],
+            streaming: bool = False,
+            share_key: Optional[Callable[..., Optional[Hashable]]] = None
+    ):
+        """
+        Constructor.
+
+        Args:
+            func: Generating function.
+            name: Name under which the function is registered.
+            estimate: Function that returns a :class:`SizeEstimate` for a sequence
+                of output words. Additional keyword arguments of the generating
+                function are passed on.
+            streaming: Words can be generated in independent chunks.
+            share_key: Function that returns the key of a shared :class:`Inventory`
+                or :class:`Machine` from its class name and constructor arguments
+                (``None`` for nodes that are not shared). Additional keyword
+                arguments of the generating function are passed on. Defaults to
+                :func:`share_nothing`.
+        """
+        self.func = func
+        self.name = name
+        self.estimate = estimate
+        self.streaming = streaming
+        self.share_key = share_nothing if share_key is None else share_key
+
+    def estimate_size(self, words: Sequence[str], **kwargs) -> SizeEstimate:
+        """
+        Estimate the size of the system generated for `words`.
+
+        Args:
+            words: Output words.
+            kwargs: Additional arguments of the generating function.
+
+        Returns:
+            Estimated size.
+        """
+        return self.estimate(words, **kwargs)
+
+    def check_budget(self, words: Sequence[str], memory_budget: Optional[int], **kwargs):
+        """
+        Check that the system generated for `words` fits into a memory budget.
+
+        Args:
+            words: Output words.
+            memory_budget: Memory budget in bytes. No check is done if ``None``.
+            kwargs: Additional arguments of the generating function.
+
+        Raises:
+            ValueError: If the estimated memory footprint exceeds the budget.
+        """
+        if memory_budget is None:
+            return
+        estimate = self.estimate_size(words, **kwargs)
+        if estimate.memory > memory_budget:
+            raise ValueError(
+                '{} would create ~{} nodes and ~{} edges ({} bytes), exceeding the memory budget '
+                'of {} bytes.{}'.format(
+                    self.name, estimate.nodes, estimate.edges, estimate.memory, memory_budget,
+                    ' Use AssemblySystem.generate_chunks to generate the words in chunks.'
+                    if self.streaming else ''
+                )
+            )
+
+    def __repr__(self) -> str:
+        return 'GeneratorInfo({!r})'.format(self.name)
+
+
+_generators: Dict[str, GeneratorInfo] = {}
+
+
+def register_generator(
+        name: str,
+        estimate: Callable[..., SizeEstimate],
+        streaming: bool = False,
+        share_key: Optional[Callable[..., Optional[Hashable]]] = None
+) -> Callable[[Callable], Callable]:
+    """
+    Decorator that registers a generating function, see :class:`GeneratorInfo`
+    for the meaning of the arguments.
+
+    Returns:
+        Decorator that returns the unmodified generating function.
+    """
+    def decorator(func: Callable) -> Callable:
+        if name in _generators:
+            raise ValueError('A generating function named {} is already registered.'.format(name))
+        _generators[name] = GeneratorInfo(func, name, estimate, streaming, share_key)
+        return func
+    return decorator
+
+
+def get_generator(func: Union[str, Callable]) -> Optional[GeneratorInfo]:
+    """
+    Look up the metadata of a generating function.
+
+    Args:
+        func: Generating function or name it was registered under.
+
+    Returns:
+        Metadata, ``None`` if `func` is a function that was not registered.
+
+    Raises:
+        ValueError: If `func` is a name that was not registered.
+    """
+    # Make sure that the functions in the algorithms module are registered.
+    import wordmill.algorithms
+    if isinstance(func, str):
+        if func not in _generators:
+            raise ValueError('No generating function named {} registered. Choose from {}.'.format(
+                func, sorted(_generators)
+            ))
+        return _generators[func]
+    for info in _generators.values():
+        if info.func is func:
+            return info
+    return None
+
+
+def registered_generators() -> List[GeneratorInfo]:
+    """
+    All registered generating functions.
+
+    Returns:
+        List of metadata of all registered functions.
+    """
+    import wordmill.algorithms
+    return list(_generators.values())
+
+
+def _alphabet_size(words: Sequence[str]) -> int:
+    return len({w[i:i + 1] for w in words for i in range(len(w))})
+
+
+def bytes_per_atom(words: Sequence[str]) -> int:
+    """
+    Upper bound of the bytes needed per character or token of words.
+    """
+    if any(not isinstance(w, str) for w in words):
+        # References to token ids
+        return 8
+    return 1 if all(w.isascii() for w in words) else 4
+
+
+def _tree_atoms(n: int) -> int:
+    """
+    Upper bound of the number of characters or tokens held by the nodes of a binary tree of
+    machines that assembles a word of length `n`, reached if the tree is a chain. Inventories
+    and the sink hold their word, machines their two input words and their output word.
+    """
+    inventories = n * (n + 1) // 2 + n - 1
+    machines = 2 * (n * (n + 1) // 2 - 1)
+    return inventories + machines + n
+
+
+def estimate_tree(words: Sequence[str], **kwargs) -> SizeEstimate:
+    """
+    Size of systems in which every output word is assembled by a binary tree
+    of machines (one tree per word, only sources are shared). For a word of
+    length `n`, `n - 1` machines, `2n - 1` inventories and a sink are created
+    that are connected by `4n - 2` edges.
+    """
+    n = sum(len(w) for w in words)
+    atoms = sum(_tree_atoms(len(w)) for w in words) + _alphabet_size(words)
+    return SizeEstimate(
+        3 * n - len(words) + _alphabet_size(words),
+        4 * n - 2 * len(words),
+        atoms * bytes_per_atom(words)
+    )
+
+
+def estimate_standard_products(
+        words: Sequence[str],
+        w_standard: Sequence[str] = (),
+        **kwargs
+) -> SizeEstimate:
+    """
+    Upper bound for the size of systems created by
+    :func:`~wordmill.algorithms.form_late_product_differentiation`: every output and standard
+    word is assembled by at most one binary tree of machines.
+    """
+    total = estimate_tree(words)
+    # Standard words are assembled once, but are not consumed by a sink
+    n = sum(len(w) for w in w_standard)
+    atoms = sum(_tree_atoms(len(w)) - len(w) for w in w_standard)
+    return total + SizeEstimate(
+        3 * n - 2 * len(w_standard),
+        4 * n - 3 * len(w_standard),
+        atoms * bytes_per_atom(list(words) + list(w_standard))
+    )
+
+
+def share_nothing(class_name: str, args: Tuple, **kwargs) -> Optional[Hashable]:
+    """
+    Share key of generating functions that do not share intermediate nodes.
+    """
+    return None
+
+
+def share_all(class_name: str, args: Tuple, **kwargs) -> Optional[Hashable]:
+    """
+    Share key of generating functions that create at most one inventory per word and one machine
+    per split (:func:`~wordmill.algorithms.form_bio_inspired_assembly`).
+    """
+    return class_name, args
+
+
+def share_standard_products(
+        class_name: str,
+        args: Tuple,
+        w_standard: Sequence[str] = (),
+        **kwargs
+) -> Optional[Hashable]:
+    """
+    Share key of :func:`~wordmill.algorithms.form_late_product_differentiation`, which creates
+    one inventory per standard word.
+    """
+    if class_name == 'Inventory' and args[0] in w_standard:
+        return class_name, args
+    return None
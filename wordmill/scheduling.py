@@ -0,0 +1,160 @@
+"""
+Layered production schedules for :class:`~wordmill.node_types.AssemblySystem` instances.
+
+Machines are grouped into stages (topological layers): a :class:`Machine` can run
+once all of its input inventories are filled, an :class:`Inventory` is filled as
+soon as any of its supplying machines has run (see :mod:`wordmill.analysis` for
+these AND/OR semantics). Within each stage, machines are assigned to a number of
+parallel workstations by list scheduling, longest processing time first. Stages
+run one after the other, so the makespan of the schedule is the sum of the
+makespans of the stages.
+
+Every machine of the system is scheduled, including alternative (redundant)
+machines that supply an inventory which is already filled by another machine.
+Their processing times count towards the makespan, so a schedule describes
+running the whole system, not its cheapest path to the sinks.
+
+Layers and schedules need a single pass over the cached topological order of the
+system and a sort per stage, so they can be recomputed cheaply for every
+candidate design of a sweep over generating functions.
+"""
+from __future__ import annotations
+import heapq
+from typing import Dict, List, NamedTuple, Optional
+
+from wordmill.node_types import Node, Machine, Sink, AssemblySystem
+
+
+class ScheduledTask(NamedTuple):
+    """
+    Machine assigned to a workstation and time slot.
+    """
+    #: Scheduled machine.
+    machine: Machine
+    #: Stage of the machine (starting with 0).
+    layer: int
+    #: Workstation the machine runs on (starting with 0).
+    workstation: int
+    #: Start time.
+    start: float
+    #: End time.
+    end: float
+
+
+class Schedule:
+    """
+    Result of :func:`schedule`.
+    """
+    def __init__(self, tasks: List[ScheduledTask], layer_ends: List[float]):
+        """
+        Constructor.
+
+        Args:
+            tasks: Scheduled machines, ordered by layer and start time.
+            layer_ends: End time of every layer.
+        """
+        self.tasks = tasks
+        self.layer_ends = layer_ends
+
+    @property
+    def makespan(self) -> float:
+        """
+        Time at which all machines have run.
+
+        Returns:
+            Makespan of the schedule.
+        """
+        return self.layer_ends[-1] if len(self.layer_ends) > 0 else 0.0
+
+    @property
+    def n_layers(self) -> int:
+        """
+        Number of stages.
+
+        Returns:
+            Number of stages.
+        """
+        return len(self.layer_ends)
+
+    def __repr__(self) -> str:
+        return 'Schedule(n_tasks={}, n_layers={}, makespan={})'.format(
+            len(self.tasks), self.n_layers, self.makespan
+        )
+
+
+def layers(system: AssemblySystem) -> List[List[Machine]]:
+    """
+    Group the machines of a system into topological layers. A machine is in the
+    layer following the latest of its input inventories, an inventory is filled
+    in the layer of its earliest supplying machine. Inventories that are supplied
+    by sources (or by no node at all) are filled before the first layer.
+
+    Args:
+        system: Assembly system.
+
+    Returns:
+        List of layers, each a list of machines in topological order.
+    """
+    # Number of layers needed to fill every node
+    level: Dict[Node, int] = {}
+    result: List[List[Machine]] = []
+    for n in system.topological_order:
+        if len(n.input_nodes) == 0:
+            level[n] = 0
+        elif isinstance(n, Machine):
+            level[n] = 1 + max(level[i] for i in n.input_nodes)
+            if level[n] > len(result):
+                result.append([])
+            result[level[n] - 1].append(n)
+        elif isinstance(n, Sink):
+            continue
+        else:
+            level[n] = min(level[i] for i in n.input_nodes)
+    return result
+
+
+def schedule(
+        system: AssemblySystem,
+        n_workstations: int = 1,
+        processing_times: Optional[Dict[Machine, float]] = None,
+        default_time: float = 1.0
+) -> Schedule:
+    """
+    Compute a layered production schedule. The machines of every layer (see
+    :func:`layers`) are assigned, longest processing time first, to the workstation
+    that becomes available first. A layer starts when all machines of the previous
+    layer have run.
+
+    Args:
+        system: Assembly system to schedule.
+        n_workstations: Number of parallel workstations per layer.
+        processing_times: Processing time per machine.
+        default_time: Processing time of machines missing from `processing_times`.
+
+    Returns:
+        :class:`Schedule` of all machines of the system.
+
+    Raises:
+        ValueError: If `n_workstations` is smaller than one.
+    """
+    if n_workstations < 1:
+        raise ValueError('At least one workstation is needed.')
+    if processing_times is None:
+        processing_times = {}
+    tasks: List[ScheduledTask] = []
+    layer_ends: List[float] = []
+    start = 0.0
+    for k, machines in enumerate(layers(system)):
+        # Sort is stable, equal processing times keep the topological order.
+        machines = sorted(machines, key=lambda m: -processing_times.get(m, default_time))
+        available = [(start, w) for w in range(min(n_workstations, len(machines)))]
+        end = start
+        for m in machines:
+            t0, w = heapq.heappop(available)
+            t1 = t0 + processing_times.get(m, default_time)
+            tasks.append(ScheduledTask(m, k, w, t0, t1))
+            heapq.heappush(available, (t1, w))
+            end = max(end, t1)
+        layer_ends.append(end)
+        start = end
+    return Schedule(tasks, layer_ends)
@@ -0,0 +1,211 @@
+"""
+Sharded generation of assembly systems for large portfolios of output words.
+
+The output words are partitioned into shards of words that share many sub-words,
+the system of every shard is generated separately (optionally in parallel worker
+processes) and the shards are merged into a single
+:class:`~wordmill.node_types.AssemblySystem`. Nodes that the generating function
+shares between output words are identified by their share key (see
+:mod:`wordmill.registry`) and merged, such that the result is identical (up to the
+order of edges) to the system generated in a single process.
+
+Worker processes return shards in a flat representation (a list of node
+descriptors in topological order and the input nodes of every node) instead of
+pickling the node objects, so memory per worker is bounded by the size of its
+shard. Shards are not checked on their own, edges are copied into the merged
+system without checks and the merged system is checked once.
+"""
+from __future__ import annotations
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple, Union
+
+from wordmill import node_types
+from wordmill.node_types import Node, Source, Sink, Word, AssemblySystem
+from wordmill.registry import get_generator
+
+# Flat representation of a generated shard: node descriptors (class name and constructor
+# arguments) in topological order, and the input nodes of every node as indices into the
+# descriptor list.
+_Shard = Tuple[List[Tuple[str, Tuple[Word, ...]]], List[List[int]]]
+
+
+def _grams(word: Word, k: int) -> Set[Word]:
+    """
+    All sub-words of length `k` of a word (the word itself if it is shorter).
+    """
+    if len(word) <= k:
+        return {word}
+    return {word[i:i + k] for i in range(len(word) - k + 1)}
+
+
+def partition_words(
+        words: Sequence[Word],
+        n_shards: int,
+        k: int = 3,
+        cost: Optional[Callable[[Word], int]] = None,
+        slack: float = 0.1
+) -> List[List[Word]]:
+    """
+    Partition words into shards such that words sharing sub-words of length `k`
+    preferably end up in the same shard, while the total cost of all shards is
+    balanced.
+
+    Words are assigned greedily, longest words first, to the shard that already
+    contains most of their sub-words and still has capacity.
+
+    Args:
+        words: Words to partition.
+        n_shards: Number of shards.
+        k: Length of the sub-words used to measure the similarity of words.
+        cost: Cost of a word, e.g. the estimated number of nodes created for it.
+            Defaults to the length of the word.
+        slack: Fraction by which the cost of a shard may exceed the average cost.
+
+    Returns:
+        List of (non-empty) shards.
+
+    Raises:
+        ValueError: If `n_shards` is smaller than one.
+    """
+    if n_shards < 1:
+        raise ValueError('Number of shards must be positive.')
+    if cost is None:
+        cost = len
+    costs = {w: cost(w) for w in words}
+    capacity = max(
+        math.ceil(sum(costs.values()) / n_shards * (1.0 + slack)),
+        max(costs.values(), default=0)
+    )
+    shards: List[List[Word]] = [[] for _ in range(n_shards)]
+    loads = [0] * n_shards
+    # Inverted index from sub-words to the shards containing them
+    gram_shards: Dict[Word, Set[int]] = {}
+    for w in sorted(costs, key=len, reverse=True):
+        grams = _grams(w, k)
+        scores: Dict[int, int] = {}
+        for g in grams:
+            for i in gram_shards.get(g, ()):
+                scores[i] = scores.get(i, 0) + 1
+        candidates = [i for i in range(n_shards) if loads[i] + costs[w] <= capacity]
+        if len(candidates) == 0:
+            candidates = list(range(n_shards))
+        best = max(candidates, key=lambda i: (scores.get(i, 0), -loads[i]))
+        shards[best].append(w)
+        loads[best] += costs[w]
+        for g in grams:
+            gram_shards.setdefault(g, set()).add(best)
+    return [s for s in shards if len(s) > 0]
+
+
+def _constructor_args(n: Node) -> Tuple[Word, ...]:
+    return n.inputs if len(n.inputs) > 0 else n.outputs
+
+
+def _generate_shard(name: str, words: Sequence[Word], kwargs: Dict) -> _Shard:
+    """
+    Generate the system for a shard and translate it to the flat representation. The shard is
+    not checked, the merged system is checked once in :func:`generate_sharded`.
+    """
+    order = AssemblySystem.generate_from_iterable(
+        name, words, check_coverage=False, **kwargs
+    ).topological_order
+    index = {n: i for i, n in enumerate(order)}
+    descriptors = [(n.__class__.__name__, _constructor_args(n)) for n in order]
+    inputs = [[index[i] for i in n.input_nodes] for n in order]
+    return descriptors, inputs
+
+
+def _merge_shard(
+        shard: _Shard,
+        share_key: Callable[..., Optional[Hashable]],
+        shared: Dict[Hashable, Node],
+        kwargs: Dict
+):
+    """
+    Add the nodes of a shard to the merged system. Nodes whose key is already present are
+    reused, nodes that only feed reused nodes are dropped (they are already present as inputs of
+    the reused nodes).
+    """
+    descriptors, inputs = shard
+    keys = []
+    for class_name, args in descriptors:
+        if class_name in ('Source', 'Sink'):
+            keys.append((class_name, args))
+        else:
+            keys.append(share_key(class_name, args, **kwargs))
+    # Backward pass to determine which nodes need to be created: sinks and all nodes that
+    # feed a created node
+    nodes: List[Optional[Node]] = [None] * len(descriptors)
+    needed = [False] * len(descriptors)
+    create = [False] * len(descriptors)
+    for i in reversed(range(len(descriptors))):
+        if keys[i] is not None and keys[i] in shared:
+            nodes[i] = shared[keys[i]]
+        elif needed[i] or descriptors[i][0] == 'Sink':
+            create[i] = True
+            for j in inputs[i]:
+                needed[j] = True
+    # Forward pass to create nodes and edges. Edges were checked when the shard was generated.
+    for i, (class_name, args) in enumerate(descriptors):
+        if create[i]:
+            nodes[i] = getattr(node_types, class_name)(*args)
+            if keys[i] is not None:
+                shared[keys[i]] = nodes[i]
+            for j in inputs[i]:
+                node_types.form_edge(nodes[j], nodes[i], check=False)
+
+
+def generate_sharded(
+        func: Union[str, Callable],
+        words: Sequence[Word],
+        n_shards: int,
+        processes: Optional[int] = None,
+        k: int = 3,
+        **kwargs
+) -> AssemblySystem:
+    """
+    Generate an assembly system by generating shards of output words separately and
+    merging the results.
+
+    Args:
+        func: Registered generating function or its name.
+        words: Output words.
+        n_shards: Number of shards, see :func:`partition_words`.
+        processes: Number of worker processes. Shards are generated sequentially
+            in the current process if ``None``.
+        k: Length of the sub-words used to cluster words into shards.
+        kwargs: Any other named arguments are passed as additional arguments
+            to `func`.
+
+    Returns:
+        Merged assembly system.
+
+    Raises:
+        ValueError: If `func` is not a registered generating function or if a node of
+            the merged system is insufficiently connected (see
+            :meth:`AssemblySystem.discover`).
+    """
+    info = get_generator(func)
+    if info is None:
+        raise ValueError('Sharded generation requires a registered generating function.')
+    words = list(dict.fromkeys(words))
+    shards = partition_words(
+        words, n_shards, k, cost=lambda w: info.estimate_size([w], **kwargs).nodes
+    )
+    shared: Dict[Hashable, Node] = {}
+    if processes is None:
+        for shard_words in shards:
+            shard = _generate_shard(info.name, shard_words, kwargs)
+            _merge_shard(shard, info.share_key, shared, kwargs)
+    else:
+        with ProcessPoolExecutor(processes) as pool:
+            results = pool.map(
+                _generate_shard,
+                [info.name] * len(shards),
+                shards,
+                [kwargs] * len(shards)
+            )
+            for shard in results:
+                _merge_shard(shard, info.share_key, shared, kwargs)
+    return AssemblySystem.discover([n for n in shared.values() if isinstance(n, (Source, Sink))])
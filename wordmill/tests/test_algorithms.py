@@ -1,7 +1,11 @@
+import os
+import subprocess
+import sys
+
 import pytest
 import networkx as nx
 
-from wordmill import AssemblySystem
+from wordmill import AssemblySystem, Node
 from wordmill.algorithms import form_linear_assembly, form_component_assembly, \
     form_product_focussed_team_assembly, form_bio_inspired_assembly
 
@@ -134,3 +138,47 @@ grid_test_algorithm_isomorphism = [
 @pytest.mark.parametrize('assembly_system, edge_list', grid_test_algorithm_isomorphism)
 def test_algorithms_isomorphism(assembly_system, edge_list):
     assert nx.is_isomorphic(assembly_system.to_digraph(), nx.MultiDiGraph(edge_list))
+
+
+grid_test_algorithm_reproducibility = [
+    # Structure
+    # - Name of the generating function
+    # - Output words
+    # - Additional arguments
+    ['linear', ['abcd', 'bcde'], {}],
+    ['component', ['abcd', 'bcde'], {}],
+    ['product_focussed_team', ['abcd', 'bcde'], {}],
+    ['bio_inspired', ['abcd', 'bcde', 'xbcy'], {}],
+    ['late_product_differentiation', ['xabcy', 'abcdz'], {'w_standard': {'ab', 'bc', 'cd'}}],
+]
+
+_export_script = """
+from wordmill import AssemblySystem
+system = AssemblySystem.generate({!r}, *{!r}, **{!r})
+print(system.to_graphviz())
+print(system.to_edge_list())
+"""
+
+
+@pytest.mark.parametrize('name, words, kwargs', grid_test_algorithm_reproducibility)
+def test_algorithms_reproducibility(name, words, kwargs):
+    """
+    Traversals and exports are identical for repeated runs, also with different hash seeds.
+    """
+    systems = [AssemblySystem.generate(name, *words, **kwargs) for _ in range(2)]
+    assert systems[0].to_graphviz() == systems[1].to_graphviz()
+    assert systems[0].to_edge_list() == systems[1].to_edge_list()
+    for system in systems:
+        nodes = system.get_nodes_of_type(Node)
+        assert [n.id for n in nodes] == sorted(n.id for n in nodes)
+    assert [repr(n) for n in systems[0].topological_order] == \
+        [repr(n) for n in systems[1].topological_order]
+    outputs = set()
+    for seed in ['0', '1', '2']:
+        outputs.add(subprocess.run(
+            [sys.executable, '-c', _export_script.format(name, words, kwargs)],
+            env=dict(os.environ, PYTHONHASHSEED=seed),
+            capture_output=True,
+            check=True
+        ).stdout)
+    assert len(outputs) == 1
@@ -0,0 +1,121 @@
+"""
+Function tests the `wordmill.analysis` module.
+"""
+import pytest
+
+from wordmill import AssemblySystem, Machine, Sink
+from wordmill.algorithms import form_linear_assembly, form_component_assembly, \
+    form_bio_inspired_assembly, form_late_product_differentiation
+from wordmill.analysis import critical_paths, bottlenecks, single_points_of_failure
+
+
+def test_topological_order():
+    """
+    Every node has to be listed after all of its input nodes and the order has to be cached.
+    """
+    system = AssemblySystem.generate(form_bio_inspired_assembly, 'abcd', 'bcde')
+    order = system.topological_order
+    position = {n: i for i, n in enumerate(order)}
+    assert len(order) == len(system.get_nodes_of_type(object))
+    for n in order:
+        assert all(position[i] < position[n] for i in n.input_nodes)
+    assert system.topological_order is order
+    system.invalidate_caches()
+    assert system.topological_order is not order
+
+
+grid_test_critical_paths = [
+    # Structure
+    # - Generating function
+    # - Output word
+    # - Dictionary, keyed by machine input words, with processing times
+    # - Expected lead time
+    # - Expected input words of bottleneck machine
+    [form_linear_assembly, 'abcd', {}, 3.0, None],
+    [form_linear_assembly, 'abcd', {('b', 'cd'): 5.0}, 7.0, ('b', 'cd')],
+    [form_component_assembly, 'abcd', {}, 2.0, None],
+    [form_component_assembly, 'abcd', {('a', 'b'): 4.0}, 5.0, ('a', 'b')],
+    # Alternative machines: the fastest alternative determines the lead time.
+    [form_bio_inspired_assembly, 'abc', {('a', 'b'): 5.0, ('ab', 'c'): 5.0}, 2.0, None],
+    [form_bio_inspired_assembly, 'abc', {('a', 'b'): 5.0, ('a', 'bc'): 3.0}, 4.0, ('a', 'bc')],
+    # The bottleneck lies on the critical path, even if an alternative has a faster bottleneck.
+    [
+        form_bio_inspired_assembly, 'abc', {('b', 'c'): 3.0, ('a', 'b'): 2.0, ('ab', 'c'): 2.5},
+        4.0, ('b', 'c')
+    ],
+]
+
+
+@pytest.mark.parametrize(
+    'func, word, times, expected_lead_time, expected_bottleneck',
+    grid_test_critical_paths
+)
+def test_critical_paths(func, word, times, expected_lead_time, expected_bottleneck):
+    """
+    Test lead times, paths and bottlenecks computed by :func:`critical_paths`.
+    """
+    system = AssemblySystem.generate(func, word)
+    processing_times = {
+        m: times[m.inputs]
+        for m in system.get_nodes_of_type(Machine)
+        if m.inputs in times
+    }
+    sink, = system.get_nodes_of_type(Sink)
+    p = critical_paths(system, processing_times)[sink]
+    assert p.lead_time == expected_lead_time
+    assert p.path[-1] is sink
+    assert len(p.path[0].input_nodes) == 0
+    assert sum(processing_times.get(m, 1.0) for m in p.machines) == expected_lead_time
+    if expected_bottleneck is None:
+        assert p.cycle_time == 1.0
+    else:
+        assert p.bottleneck.inputs == expected_bottleneck
+        assert p.bottleneck in p.machines
+        assert p.cycle_time == max(processing_times.get(m, 1.0) for m in p.machines)
+        assert bottlenecks(system, processing_times)[sink] is p.bottleneck
+
+
+def _producible_sinks(system, failed_machine):
+    """
+    Brute force evaluation of the sinks that can still be supplied if a machine fails.
+    """
+    producible = {}
+    for n in system.topological_order:
+        if n is failed_machine:
+            producible[n] = False
+        elif len(n.input_nodes) == 0:
+            producible[n] = True
+        elif isinstance(n, Machine):
+            producible[n] = all(producible[i] for i in n.input_nodes)
+        else:
+            producible[n] = any(producible[i] for i in n.input_nodes)
+    return {s for s in system.get_nodes_of_type(Sink) if producible[s]}
+
+
+grid_test_single_points_of_failure = [
+    # Structure
+    # - Generating function
+    # - Output words
+    # - Additional arguments
+    [form_linear_assembly, ['abcd', 'cba'], {}],
+    [form_bio_inspired_assembly, ['abcd', 'bcx', 'ab'], {}],
+    [form_late_product_differentiation, ['xaby', 'abz', 'q'], {'w_standard': ['ab']}],
+]
+
+
+@pytest.mark.parametrize('func, words, kwargs', grid_test_single_points_of_failure)
+def test_single_points_of_failure(func, words, kwargs):
+    """
+    Compare with the brute force approach of failing one machine at a time.
+    """
+    system = AssemblySystem.generate(func, *words, **kwargs)
+    sinks = set(system.get_nodes_of_type(Sink))
+    result = single_points_of_failure(system)
+    assert set(result) == set(system.get_nodes_of_type(Machine))
+    for m, affected in result.items():
+        assert set(affected) == sinks - _producible_sinks(system, m)
+    if func is form_bio_inspired_assembly:
+        # Only the machine producing 'ab' is indispensable (for sink 'ab')
+        assert {m.inputs: [s.word for s in a] for m, a in result.items() if len(a) > 0} == {
+            ('a', 'b'): ['ab']
+        }
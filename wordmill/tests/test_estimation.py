@@ -0,0 +1,63 @@
+"""
+Function tests the `wordmill.estimation` module.
+"""
+import pytest
+
+from wordmill import AssemblySystem, Node
+from wordmill.estimation import substring_stats, estimate_distinct_substrings, \
+    estimate_team_substrings
+
+grid_test_substring_stats = [
+    # Structure
+    # - Words
+    ['a'],
+    ['aaaa'],
+    ['abcab', 'bcd'],
+    ['abab', 'ab', 'babb'],
+    ['mississippi', 'missouri'],
+    [(1, 2, 3, 1, 2), (2, 3)],
+]
+
+
+@pytest.mark.parametrize('words', grid_test_substring_stats)
+def test_substring_stats(words):
+    """
+    Statistics match the brute force enumeration of all substrings.
+    """
+    substrings = {w[i:j] for w in words for i in range(len(w)) for j in range(i + 1, len(w) + 1)}
+    stats = substring_stats(words)
+    assert stats.distinct == len(substrings)
+    assert stats.total_length == sum(len(s) for s in substrings)
+    assert stats.alphabet == sum(1 for s in substrings if len(s) == 1)
+    assert stats.squared_length == sum(len(s) ** 2 for s in substrings)
+
+
+grid_test_estimate_exact = [
+    # Structure
+    # - Generating function name
+    # - Estimating function
+    # - Output words
+    ['bio_inspired', estimate_distinct_substrings, ['a', 'abcab', 'bcd', 'abcab']],
+    ['bio_inspired', estimate_distinct_substrings, ['aabaa', 'baab']],
+    ['bio_inspired', estimate_distinct_substrings, [(1, 2, 3, 1, 2), (2, 3)]],
+    ['product_focussed_team', estimate_team_substrings, ['abab', 'aa', 'abcab']],
+    ['product_focussed_team', estimate_team_substrings, ['aaaa', 'baab']],
+]
+
+
+@pytest.mark.parametrize('name, estimate, words', grid_test_estimate_exact)
+def test_estimate_exact(name, estimate, words):
+    """
+    Estimates match the size of the generated systems, including repeated substrings.
+    """
+    nodes = AssemblySystem.generate(name, *words).get_nodes_of_type(Node)
+    assert estimate(words)[:2] == (len(nodes), sum(len(n.output_nodes) for n in nodes))
+
+
+def test_admission_check():
+    """
+    Requests for long words are refused without creating nodes.
+    """
+    words = ['abcdefghij' * 40, 'klmnopqrst' * 40]
+    with pytest.raises(ValueError, match='exceeding the memory budget'):
+        AssemblySystem.generate('bio_inspired', *words, memory_budget=10 ** 8)
@@ -0,0 +1,106 @@
+"""
+Function tests the `wordmill.hierarchy` module.
+"""
+import pytest
+
+from wordmill import AssemblySystem, Node, Machine, Inventory, Sink
+from wordmill.algorithms import form_late_product_differentiation, \
+    form_product_focussed_team_assembly, form_component_assembly
+from wordmill.hierarchy import Assembly, collapse, standard_product_roots, team_roots
+from wordmill.validation import validate
+
+words = ['xabcdy', 'abcdz', 'wabc', 'qcd']
+w_standard = ['abcd', 'abc', 'cd']
+
+
+def test_collapse_standard_products():
+    """
+    Standard products are collapsed into super-nodes, other roots stay at the boundary.
+    """
+    system = AssemblySystem.generate(
+        form_late_product_differentiation, *words, w_standard=w_standard
+    )
+    roots = standard_product_roots(system, w_standard)
+    assert sorted(r.word for r in roots) == sorted(w_standard)
+    collapsed = collapse(system, roots)
+    assert validate(collapsed).valid
+    assert len(collapsed.get_nodes_of_type(Node)) < len(system.get_nodes_of_type(Node))
+    assemblies = {a.word: a for a in collapsed.get_nodes_of_type(Assembly)}
+    assert sorted(assemblies) == sorted(w_standard)
+    # 'abcd' is assembled from the standard product 'abc' and 'd'
+    assert sorted(assemblies['abcd'].inputs) == ['abc', 'd']
+    assert sorted(assemblies['cd'].inputs) == ['c', 'd']
+    # Sinks and their words are preserved
+    assert sorted(s.word for s in collapsed.get_nodes_of_type(Sink)) == sorted(words)
+    # Drill down into the detail of 'abcd'
+    detail = assemblies['abcd'].expand()
+    assert all(n in system.get_nodes_of_type(Node) for n in assemblies['abcd'].members)
+    assert sorted(m.word for m in detail.get_nodes_of_type(Machine)) == ['abcd']
+    assert 'shape=box' in collapsed.to_graphviz()
+
+
+def test_collapse_teams():
+    """
+    Every team of a product focussed team assembly becomes a single super-node.
+    """
+    system = AssemblySystem.generate(form_product_focussed_team_assembly, 'abcd', 'xyz')
+    collapsed = collapse(system, team_roots(system))
+    assert validate(collapsed).valid
+    # Only sources, inventories fed by sources, the final inventories and sinks remain
+    assert len(collapsed.get_nodes_of_type(Machine)) == 3 + 2
+    assert all(isinstance(m, Assembly) for m in collapsed.get_nodes_of_type(Machine))
+    assert sorted(len(m.inputs) for m in collapsed.get_nodes_of_type(Machine)) == [3, 3, 4, 4, 4]
+    # Collapsing the collapsed system again keeps the detail
+    nested = collapse(
+        collapsed, [i for i in collapsed.get_nodes_of_type(Inventory) if len(i.word) > 1]
+    )
+    assert validate(nested).valid
+    assert len(nested.get_nodes_of_type(Assembly)) == 2
+    assert sorted(len(a.members) for a in nested.get_nodes_of_type(Assembly)) == [2, 3]
+
+
+def test_collapse_invalid_root():
+    system = AssemblySystem.generate(form_component_assembly, 'ab')
+    with pytest.raises(ValueError, match='Only inventories and machines can be collapsed'):
+        collapse(system, system.get_nodes_of_type(Sink))
+
+
+grid_test_collapse_machines = [
+    # Structure
+    # - Generating function name
+    # - Output words
+    ['linear', ['abc']],
+    ['linear', ['abcde', 'bcd']],
+    ['component', ['abcdefg']],
+    ['bio_inspired', ['abcd']],
+]
+
+
+@pytest.mark.parametrize('name, words', grid_test_collapse_machines)
+def test_collapse_machines(name, words):
+    """
+    Chained machine roots are collapsed into one super-node each, connected by inventories.
+    """
+    system = AssemblySystem.generate(name, *words)
+    machines = system.get_nodes_of_type(Machine)
+    collapsed = collapse(system, machines)
+    assert validate(collapsed).valid
+    assemblies = collapsed.get_nodes_of_type(Assembly)
+    assert len(assemblies) == len(machines)
+    assert all(len(a.members) == 1 for a in assemblies)
+    assert len(collapsed.get_nodes_of_type(Inventory)) == \
+        len(system.get_nodes_of_type(Inventory))
+
+
+def test_collapse_mixed_roots():
+    """
+    Machines consuming a root inventory remain part of the region of a downstream root.
+    """
+    system = AssemblySystem.generate(form_component_assembly, 'cdccaca', 'dcacbbb')
+    roots = [n for n in system.get_nodes_of_type(Machine) if n.inputs in [('b', 'b'), ('d', 'ca')]]
+    roots += [
+        n for n in system.get_nodes_of_type(Inventory) if n.word in ['cdccaca', 'dcacbbb', 'dc']
+    ]
+    collapsed = collapse(system, roots)
+    assert validate(collapsed).valid
+    assert len(collapsed.get_nodes_of_type(Assembly)) == len(roots)
@@ -0,0 +1,59 @@
+"""
+Function tests the `wordmill.ingestion` module and
+:meth:`AssemblySystem.generate_from_iterable`.
+"""
+import pytest
+import networkx as nx
+
+from wordmill import AssemblySystem, Source, Sink
+from wordmill.algorithms import form_component_assembly, form_bio_inspired_assembly
+from wordmill.ingestion import read_words, read_words_columnar, unique_words, chunked
+
+
+def test_read_words(tmp_path):
+    """
+    Words are streamed line by line, skipping empty lines and comments.
+    """
+    path = tmp_path / 'portfolio.txt'
+    path.write_text('# portfolio\nabc\n\n  bcd \nabc\nxyz')
+    assert list(read_words(str(path))) == ['abc', 'bcd', 'abc', 'xyz']
+    assert list(unique_words(read_words(str(path)))) == ['abc', 'bcd', 'xyz']
+    empty = tmp_path / 'empty.txt'
+    empty.write_text('')
+    assert list(read_words(str(empty))) == []
+
+
+def test_read_words_columnar(tmp_path):
+    """
+    Words are streamed from string and token columns of Parquet files.
+    """
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+    path = str(tmp_path / 'portfolio.parquet')
+    pq.write_table(pa.table({'word': ['ab', None, 'cd'], 'tokens': [[1, 2], [3], None]}), path)
+    assert list(read_words_columnar(path, 'word', batch_size=1)) == ['ab', 'cd']
+    assert list(read_words_columnar(path, 'tokens')) == [(1, 2), (3,)]
+
+
+def test_unique_words():
+    words = list(unique_words(iter(['ab' + 'c', (1, 2), 'abc', (1, 2), 'x'])))
+    assert words == ['abc', (1, 2), 'x']
+
+
+def test_chunked():
+    assert list(chunked(iter('abcde'), 2)) == [['a', 'b'], ['c', 'd'], ['e']]
+    with pytest.raises(ValueError, match='Chunk size must be positive'):
+        list(chunked('abc', 0))
+
+
+@pytest.mark.parametrize('func', [form_component_assembly, form_bio_inspired_assembly])
+def test_generate_from_iterable(func):
+    """
+    Generation from a stream of words (in chunks, if supported) equals generation from varargs.
+    """
+    words = ['abcd', 'cdx', 'abcd', 'yz', 'q', 'cdx', 'xyzab']
+    system = AssemblySystem.generate_from_iterable(func, iter(words), chunk_size=2)
+    expected = AssemblySystem.generate(func, *dict.fromkeys(words))
+    assert nx.is_isomorphic(system.to_digraph(), expected.to_digraph())
+    assert len(system.get_nodes_of_type(Sink)) == 5
+    assert len(system.get_nodes_of_type(Source)) == 8
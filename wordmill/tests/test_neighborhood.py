@@ -0,0 +1,62 @@
+"""
+Function tests the `wordmill.neighborhood` module.
+"""
+import pytest
+
+from wordmill import AssemblySystem, Node, Inventory, Machine, Source, Sink
+from wordmill.algorithms import form_bio_inspired_assembly
+from wordmill.neighborhood import neighborhood, neighborhood_nodes
+
+grid_test_neighborhood = [
+    # Structure
+    # - Center word
+    # - Number of hops
+    # - Direction
+    # - Expected number of nodes per class
+    ['abcd', 0, 'upstream', {Inventory: 1}],
+    ['abcd', 1, 'upstream', {Inventory: 1, Machine: 3}],
+    ['abcd', 2, 'upstream', {Inventory: 7, Machine: 3}],
+    ['abcd', 1, 'downstream', {Inventory: 1, Machine: 1, Sink: 1}],
+    ['abcd', 1, 'both', {Inventory: 1, Machine: 4, Sink: 1}],
+    ['a', 1, 'upstream', {Inventory: 1, Source: 1}],
+]
+
+
+@pytest.mark.parametrize('word, hops, direction, expected', grid_test_neighborhood)
+def test_neighborhood(word, hops, direction, expected):
+    """
+    The neighborhood is a standalone copy of the nodes within the given number of hops.
+    """
+    system = AssemblySystem.generate(form_bio_inspired_assembly, 'abcd', 'abcde')
+    sub = neighborhood(system, word, hops, direction)
+    counts = {cls: len(sub.get_nodes_of_type(cls)) for cls in [Inventory, Machine, Source, Sink]}
+    assert counts == {cls: expected.get(cls, 0) for cls in counts}
+    # Copies are disconnected from the original system
+    nodes = set(sub.get_nodes_of_type(Node))
+    assert len(nodes & set(system.get_nodes_of_type(Node))) == 0
+    assert all(set(n.input_nodes) | set(n.output_nodes) <= nodes for n in nodes)
+    # Exports number nodes consistently
+    edges = sub.to_edge_list()
+    assert len(edges) == sum(len(n.output_nodes) for n in nodes)
+    dot = sub.to_graphviz()
+    assert all('"{}" -> "{}"'.format(i, j) in dot for i, j in edges)
+
+
+def test_neighborhood_nodes():
+    """
+    Nodes are returned in breadth-first order, starting with the center.
+    """
+    system = AssemblySystem.generate(form_bio_inspired_assembly, 'abc')
+    center = system.nodes_with_word('abc', Sink)[0]
+    nodes = neighborhood_nodes(system, center, 3)
+    assert nodes[0] is center
+    assert [n.__class__ for n in nodes[:3]] == [Sink, Inventory, Machine]
+    # Sink, inventory, two machines and inventories 'a', 'bc', 'ab', 'c'
+    assert len(nodes) == 8
+    assert set(system.nodes_with_word('abc', Machine)) == set(nodes[2:4])
+    with pytest.raises(ValueError, match='No Inventory'):
+        neighborhood_nodes(system, 'xyz', 1)
+    with pytest.raises(ValueError, match='Unknown direction'):
+        neighborhood_nodes(system, 'abc', 1, 'sideways')
+    with pytest.raises(ValueError, match='must not be negative'):
+        neighborhood_nodes(system, 'abc', -1)
@@ -3,7 +3,7 @@ Function tests the `wordmill.wordmill` module of base classes.
 """
 import pytest
 
-from wordmill import Node, Source, Sink, Machine, Inventory, form_edge
+from wordmill import Node, Source, Sink, Machine, Inventory, AssemblySystem, form_edge
 
 
 grid_test_Node_properties = [
@@ -19,7 +19,7 @@ grid_test_Node_properties = [
         {
             'word': 'test',
             'outputs': ('test',),
-            'inputs': [],
+            'inputs': (),
             'fully_connected': False,
             'neighbors': set()
         }
@@ -31,7 +31,7 @@ grid_test_Node_properties = [
         },
         {
             'word': 'test',
-            'outputs': [],
+            'outputs': (),
             'inputs': ('test',),
             'fully_connected': False,
             'neighbors': set()
@@ -83,6 +83,22 @@ def test_Node_properties(cls, kwargs, property_name, expected_value):
     assert getattr(n, property_name) == expected_value
 
 
+@pytest.mark.parametrize(
+    'cls, kwargs',
+    [(cls, kwargs) for cls, kwargs, _ in grid_test_Node_properties]
+)
+def test_Node_memory_layout(cls, kwargs):
+    """
+    Nodes should not carry a `__dict__` and should not allocate adjacency lists before the first
+    edge is formed.
+    """
+    n = cls(**kwargs)
+    assert not hasattr(n, '__dict__')
+    assert n.input_nodes == () and n.output_nodes == ()
+    if isinstance(n, Inventory):
+        assert n.inputs is n.outputs
+
+
 grid_test_Node_fully_connected = [
     # Structure
     # - Node instance
@@ -206,3 +222,38 @@ def test_Node_form_edges(source, sink, expected_result):
             source.form_outbound_edge(sink)
         with pytest.raises(ValueError, match=match):
             sink.form_inbound_edge(source)
+
+
+def test_Node_retain_edges():
+    """
+    Edges for which the predicate is false are removed from both nodes.
+    """
+    source = Source('a')
+    inventories = [Inventory('a') for _ in range(5)]
+    for inv in inventories:
+        form_edge(source, inv)
+
+    def keep(s, t):
+        return t is not inventories[1] and t is not inventories[3]
+
+    for n in [source] + inventories:
+        n.retain_edges(keep)
+    assert source.output_nodes == [inventories[0], inventories[2], inventories[4]]
+    assert inventories[1].input_nodes == () and inventories[3].input_nodes == ()
+    assert inventories[2].input_nodes == [source]
+
+
+def test_AssemblySystem_remove_nodes():
+    """
+    Removed nodes are neither part of the system nor referenced by the remaining nodes.
+    """
+    source = Source('a')
+    inventories = [Inventory('a') for _ in range(3)]
+    for inv in inventories:
+        form_edge(source, inv)
+    system = AssemblySystem([source] + inventories)
+    order = system.topological_order
+    system.remove_nodes(inventories[1:])
+    assert system.get_nodes_of_type(Node) == [source, inventories[0]]
+    assert source.output_nodes == [inventories[0]]
+    assert system.topological_order is not order
@@ -0,0 +1,70 @@
+"""
+Function tests the `wordmill.pruning` module.
+"""
+import pytest
+
+from wordmill import AssemblySystem, Node, Inventory, Machine, Sink
+from wordmill.algorithms import form_bio_inspired_assembly, form_component_assembly
+from wordmill.analysis import critical_paths
+from wordmill.pruning import prune_splits
+from wordmill.validation import validate
+
+words = ['abcdefg', 'bcdefgh', 'cdexy', 'xyab']
+
+grid_test_prune_splits = [
+    # Structure
+    # - Number of machines to keep per inventory
+    # - Strategy
+    [1, 'reuse'],
+    [2, 'reuse'],
+    [1, 'depth'],
+    [3, 'depth'],
+]
+
+
+@pytest.mark.parametrize('k, strategy', grid_test_prune_splits)
+def test_prune_splits(k, strategy):
+    """
+    Pruned systems have to be valid, smaller and supply all sinks.
+    """
+    system = AssemblySystem.generate(form_bio_inspired_assembly, *words)
+    n_nodes = len(system.get_nodes_of_type(Node))
+    lead_times = {s.word: p.lead_time for s, p in critical_paths(system).items()}
+    pruned = prune_splits(system, k, strategy)
+    # Pruned in place, removed nodes are not part of the system anymore
+    assert pruned is system
+    assert validate(pruned).valid
+    assert len(pruned.get_nodes_of_type(Node)) < n_nodes
+    assert sorted(s.word for s in pruned.get_nodes_of_type(Sink)) == sorted(words)
+    assert all(len(i.input_nodes) <= k for i in pruned.get_nodes_of_type(Inventory))
+    # Removed nodes must not be referenced anymore
+    nodes = set(pruned.get_nodes_of_type(Node))
+    assert all(set(n.input_nodes) | set(n.output_nodes) <= nodes for n in nodes)
+    if strategy == 'depth':
+        assert {s.word: p.lead_time for s, p in critical_paths(pruned).items()} == lead_times
+
+
+def test_prune_splits_reuse():
+    """
+    The reuse strategy needs fewer inventories than the depth strategy.
+    """
+    sizes = {
+        strategy: len(prune_splits(
+            AssemblySystem.generate(form_bio_inspired_assembly, *words), 1, strategy
+        ).get_nodes_of_type(Inventory))
+        for strategy in ['reuse', 'depth']
+    }
+    assert sizes['reuse'] <= sizes['depth']
+
+
+def test_prune_splits_noop():
+    """
+    Systems without alternatives are not modified.
+    """
+    system = AssemblySystem.generate(form_component_assembly, *words)
+    n_machines = len(system.get_nodes_of_type(Machine))
+    assert len(prune_splits(system, 1).get_nodes_of_type(Machine)) == n_machines
+    with pytest.raises(ValueError, match='At least one machine'):
+        prune_splits(system, 0)
+    with pytest.raises(ValueError, match='Unknown strategy'):
+        prune_splits(system, 1, 'random')
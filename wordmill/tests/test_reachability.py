@@ -0,0 +1,78 @@
+"""
+Function tests the `wordmill.reachability` module.
+"""
+import pytest
+import networkx as nx
+
+from wordmill import AssemblySystem, Node, Source, Sink, Machine, Inventory
+from wordmill.algorithms import form_linear_assembly, form_bio_inspired_assembly, \
+    form_late_product_differentiation
+from wordmill.reachability import ReachabilityIndex, _bits
+
+grid_test_reachability = [
+    # Structure
+    # - Generating function
+    # - Output words
+    # - Additional arguments
+    [form_linear_assembly, ['abc', 'cba', 'dd'], {}],
+    [form_bio_inspired_assembly, ['abcd', 'bcx', 'yz'], {}],
+    [form_late_product_differentiation, ['xaby', 'abz', 'q'], {'w_standard': ['ab']}],
+]
+
+
+@pytest.mark.parametrize('func, words, kwargs', grid_test_reachability)
+def test_reachability(func, words, kwargs):
+    """
+    Compare the index with reachability queries on the NetworkX graph.
+    """
+    system = AssemblySystem.generate(func, *words, **kwargs)
+    index = ReachabilityIndex(system)
+    g = system.to_digraph()
+    sinks = set(system.get_nodes_of_type(Sink))
+    sources = set(system.get_nodes_of_type(Source))
+    for n in system.get_nodes_of_type(Node):
+        expected_sinks = (nx.descendants(g, n) | {n}) & sinks
+        expected_sources = (nx.ancestors(g, n) | {n}) & sources
+        assert set(index.sinks_affected_by(n)) == expected_sinks
+        assert set(index.sources_feeding(n)) == expected_sources
+        assert all(index.depends_on(s, n) == (s in expected_sinks) for s in sinks)
+        assert all(index.is_fed_by(n, s) == (s in expected_sources) for s in sources)
+    machines = system.get_nodes_of_type(Machine)
+    assert set(index.sinks_affected_by_any(machines)) == {
+        s for m in machines for s in index.sinks_affected_by(m)
+    }
+    assert index.sinks_affected_by_each(machines) == {
+        m: index.sinks_affected_by(m) for m in machines
+    }
+    inventories = system.get_nodes_of_type(Inventory)
+    assert set(index.sources_feeding_any(inventories)) == sources
+    assert index.sources_feeding_each(inventories) == {
+        i: index.sources_feeding(i) for i in inventories
+    }
+
+
+def test_reachability_shares_bitsets():
+    """
+    Nodes along the chains of a linear assembly share their bitsets.
+    """
+    system = AssemblySystem.generate(form_linear_assembly, 'abcdef', 'fedcba', 'xyzuvw')
+    index = ReachabilityIndex(system)
+    assert index.n_distinct_bitsets < len(system.get_nodes_of_type(Node)) // 2
+
+
+grid_test_bits = [
+    # Structure
+    # - Positions of set bits
+    [],
+    [0],
+    [63, 64],
+    [1, 62, 127, 128, 500],
+]
+
+
+@pytest.mark.parametrize('positions', grid_test_bits)
+def test_bits(positions):
+    """
+    Set bits are decoded in ascending order, also across 64-bit word boundaries.
+    """
+    assert list(_bits(sum(1 << i for i in positions))) == positions
@@ -0,0 +1,98 @@
+"""
+Function tests the `wordmill.registry` module.
+"""
+import tracemalloc
+
+import pytest
+
+from wordmill import AssemblySystem, Node, Sink
+from wordmill.algorithms import form_linear_assembly, form_component_assembly, \
+    form_product_focussed_team_assembly, form_bio_inspired_assembly, \
+    form_late_product_differentiation
+from wordmill.registry import get_generator, registered_generators
+
+grid_test_estimate_size = [
+    # Structure
+    # - Generating function
+    # - Output words
+    # - Additional arguments
+    # - Boolean indicating if the estimate is exact
+    [form_linear_assembly, ['ab', 'bcd', 'abcde'], {}, True],
+    [form_component_assembly, ['a', 'bcd', 'abcde'], {}, True],
+    [form_bio_inspired_assembly, ['abcd', 'xyz'], {}, True],
+    [form_bio_inspired_assembly, ['abcab', 'bcd'], {}, True],
+    [form_product_focussed_team_assembly, ['abcd', 'abab'], {}, True],
+    [form_late_product_differentiation, ['xaby', 'abz'], {'w_standard': ['ab']}, False],
+]
+
+
+@pytest.mark.parametrize('func, words, kwargs, exact', grid_test_estimate_size)
+def test_estimate_size(func, words, kwargs, exact):
+    """
+    Estimates are upper bounds of the actual size of the generated system.
+    """
+    estimate = get_generator(func).estimate_size(words, **kwargs)
+    system = AssemblySystem.generate(func, *words, **kwargs)
+    nodes = system.get_nodes_of_type(Node)
+    n_edges = sum(len(n.output_nodes) for n in nodes)
+    assert estimate.nodes >= len(nodes) and estimate.edges >= n_edges
+    assert (estimate.nodes == len(nodes) and estimate.edges == n_edges) == exact
+
+
+def test_registry_lookup():
+    """
+    Generating functions can be looked up by function and name.
+    """
+    names = {info.name for info in registered_generators()}
+    assert {'linear', 'component', 'bio_inspired'} <= names
+    assert get_generator('linear').func is form_linear_assembly
+    assert get_generator(lambda sources, sinks: None) is None
+    with pytest.raises(ValueError, match='No generating function named'):
+        get_generator('unknown')
+    system = AssemblySystem.generate('component', 'abcd')
+    assert len(system.get_nodes_of_type(Sink)) == 1
+
+
+def test_memory_budget():
+    """
+    Requests exceeding the budget are refused before generation, streaming generators can
+    split them into chunks.
+    """
+    words = ['abcdef', 'ghijkl', 'mnopqr']
+    budget = get_generator(form_linear_assembly).estimate_size(words[:2]).memory
+    with pytest.raises(ValueError, match='exceeding the memory budget'):
+        AssemblySystem.generate(form_linear_assembly, *words, memory_budget=budget)
+    chunks = list(AssemblySystem.generate_chunks('linear', *words, memory_budget=budget))
+    assert [len(c.get_nodes_of_type(Sink)) for c in chunks] == [2, 1]
+    with pytest.raises(ValueError, match='does not support generation in chunks'):
+        list(AssemblySystem.generate_chunks('bio_inspired', *words, memory_budget=budget))
+
+
+grid_test_estimate_memory = [
+    # Structure
+    # - Name of the generating function
+    # - Output words
+    ['bio_inspired', ['abcdefghijklmnopqrstuvwxyz']],
+    ['bio_inspired', [(1000, 2000, 3000) * 8]],
+    ['linear', ['{:08d}'.format(i * 7919) for i in range(300)]],
+    ['product_focussed_team', ['abab' * 4]],
+]
+
+
+@pytest.mark.parametrize('name, words', grid_test_estimate_memory)
+def test_estimate_memory(name, words):
+    """
+    Estimated memory bounds the retained and the peak memory of the generation.
+    """
+    # Make sure that all modules are imported before measuring
+    AssemblySystem.generate(name, *words[:1])
+    estimate = get_generator(name).estimate_size(words)
+    tracemalloc.start()
+    try:
+        system = AssemblySystem.generate(name, *words)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(system.get_nodes_of_type(Node)) == estimate.nodes
+    assert retained <= estimate.retained_memory
+    assert peak <= estimate.memory
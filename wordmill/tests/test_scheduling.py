@@ -0,0 +1,64 @@
+"""
+Function tests the `wordmill.scheduling` module.
+"""
+import pytest
+
+from wordmill import AssemblySystem, Machine
+from wordmill.analysis import critical_paths
+from wordmill.scheduling import layers, schedule
+
+grid_test_schedule = [
+    # Structure
+    # - Generating function
+    # - Number of workstations
+    # - Expected number of machines per layer
+    # - Expected makespan
+    ['linear', 1, [2, 2, 2], 6.0],
+    ['linear', 2, [2, 2, 2], 3.0],
+    ['component', 2, [4, 2], 3.0],
+    ['bio_inspired', 1, [4, 8, 4], 16.0],
+    ['bio_inspired', 3, [4, 8, 4], 7.0],
+    ['product_focussed_team', 3, [12, 10, 4], 10.0],
+]
+
+
+@pytest.mark.parametrize('func, n_workstations, sizes, makespan', grid_test_schedule)
+def test_schedule(func, n_workstations, sizes, makespan):
+    """
+    Every machine is scheduled once, after its inputs, without overlaps on workstations.
+    """
+    system = AssemblySystem.generate(func, 'abcd', 'abce')
+    assert [len(layer) for layer in layers(system)] == sizes
+    result = schedule(system, n_workstations)
+    assert result.makespan == makespan
+    assert result.n_layers == len(sizes)
+    assert sorted(map(id, (t.machine for t in result.tasks))) == \
+        sorted(map(id, system.get_nodes_of_type(Machine)))
+    layer_of = {t.machine: t.layer for t in result.tasks}
+    for t in result.tasks:
+        assert 0 <= t.workstation < n_workstations
+        # At least one supplier of every input inventory ran in an earlier layer
+        for i in t.machine.input_nodes:
+            assert len(i.input_nodes) == 0 or any(
+                layer_of.get(m, -1) < t.layer for m in i.input_nodes
+            )
+        for u in result.tasks:
+            if u is not t and u.workstation == t.workstation:
+                assert u.end <= t.start or t.end <= u.start
+    # Stages can not be faster than the critical path
+    assert result.makespan >= max(p.lead_time for p in critical_paths(system).values())
+
+
+def test_schedule_processing_times():
+    """
+    Longest processing times are scheduled first.
+    """
+    system = AssemblySystem.generate('component', 'abcd')
+    first = layers(system)[0]
+    times = {m: float(k + 1) for k, m in enumerate(first)}
+    result = schedule(system, 2, times, default_time=0.5)
+    assert [t.machine for t in result.tasks[:2]] == [first[1], first[0]]
+    assert result.layer_ends == [2.0, 2.5]
+    assert schedule(AssemblySystem()).makespan == 0.0
+    with pytest.raises(ValueError, match='At least one workstation'):
+        schedule(system, 0)
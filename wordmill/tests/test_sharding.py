@@ -0,0 +1,57 @@
+"""
+Function tests the `wordmill.sharding` module.
+"""
+import pytest
+import networkx as nx
+
+from wordmill import AssemblySystem, Node
+from wordmill.algorithms import form_linear_assembly, form_component_assembly, \
+    form_product_focussed_team_assembly, form_bio_inspired_assembly, \
+    form_late_product_differentiation
+from wordmill.sharding import partition_words, generate_sharded
+
+words = ['abcd', 'bcde', 'cdef', 'xyz', 'xy', 'yzx', 'abab']
+
+grid_test_generate_sharded = [
+    # Structure
+    # - Generating function
+    # - Additional arguments
+    # - Number of shards
+    # - Number of processes
+    # - Additional output words
+    [form_linear_assembly, {}, 3, None, []],
+    [form_component_assembly, {}, 3, None, ['q']],
+    [form_product_focussed_team_assembly, {}, 3, None, []],
+    [form_bio_inspired_assembly, {}, 1, None, ['q']],
+    [form_bio_inspired_assembly, {}, 3, None, ['q']],
+    [form_bio_inspired_assembly, {}, 8, 2, ['q']],
+    [form_late_product_differentiation, {'w_standard': ['bc', 'cde', 'y']}, 4, None, ['q']],
+    [form_late_product_differentiation, {'w_standard': ['bc', 'cde', 'y']}, 4, 2, ['q']],
+]
+
+
+@pytest.mark.parametrize(
+    'func, kwargs, n_shards, processes, more_words',
+    grid_test_generate_sharded
+)
+def test_generate_sharded(func, kwargs, n_shards, processes, more_words):
+    """
+    Sharded generation has to result in the same system as generation in a single process.
+    """
+    expected = AssemblySystem.generate(func, *words, *more_words, **kwargs)
+    system = generate_sharded(func, words + more_words, n_shards, processes, **kwargs)
+    assert len(system.get_nodes_of_type(Node)) == len(expected.get_nodes_of_type(Node))
+    assert nx.is_isomorphic(system.to_digraph(), expected.to_digraph())
+
+
+def test_partition_words():
+    """
+    Words sharing sub-words are grouped while shards stay balanced.
+    """
+    shards = partition_words(['abcdef', 'xyzuvw', 'abcdeg', 'xyzuvv'], 2)
+    assert sorted(sorted(s) for s in shards) == [['abcdef', 'abcdeg'], ['xyzuvv', 'xyzuvw']]
+    shards = partition_words(['abc', 'abd', 'abe', 'abf'], 2, slack=0.0)
+    assert sorted(len(s) for s in shards) == [2, 2]
+    assert partition_words(['abc'], 4) == [['abc']]
+    with pytest.raises(ValueError, match='Number of shards must be positive'):
+        partition_words(['abc'], 0)
@@ -0,0 +1,79 @@
+"""
+Function tests the `wordmill.tokens` module and the support of token words by node types and
+generating functions.
+"""
+import pytest
+import networkx as nx
+
+from wordmill import AssemblySystem, Node, Source, Sink
+from wordmill.algorithms import form_linear_assembly, form_component_assembly, \
+    form_product_focussed_team_assembly, form_bio_inspired_assembly, \
+    form_late_product_differentiation
+from wordmill.tokens import Alphabet
+
+
+def test_alphabet():
+    """
+    Tokens are mapped to consecutive ids and back.
+    """
+    alphabet = Alphabet(['PN-1'])
+    word = alphabet.encode(['PN-2', 'PN-1', 'PN-3', 'PN-2'])
+    assert word == (1, 0, 2, 1)
+    assert len(alphabet) == 3 and 'PN-3' in alphabet
+    assert alphabet.decode(word[1:3]) == ['PN-1', 'PN-3']
+    assert alphabet.label(word, '/') == 'PN-2/PN-1/PN-3/PN-2'
+
+
+grid_test_Node_find_word = [
+    ('abcabd', 'abd', 3),
+    ('abcabd', 'ab', 0),
+    ('abcabd', 'abe', -1),
+    ((1, 2, 3, 1, 2, 4), (1, 2, 4), 3),
+    ((1, 2, 3, 1, 2, 4), (1, 2), 0),
+    ((1, 2, 3, 1, 2, 4), (1, 2, 5), -1),
+    ((1, 2), (1, 2, 3), -1),
+]
+
+
+@pytest.mark.parametrize('word, sub_word, expected_pos', grid_test_Node_find_word)
+def test_Node_find_word(word, sub_word, expected_pos):
+    """
+    Sub-words are found in string and token words alike.
+    """
+    assert Node.find_word(word, sub_word) == expected_pos
+
+
+grid_test_token_generation = [
+    # Structure
+    # - Generating function
+    # - Output words
+    # - Additional arguments
+    [form_linear_assembly, ['abcd', 'dcb'], {}],
+    [form_component_assembly, ['abcd', 'dcb'], {}],
+    [form_bio_inspired_assembly, ['abcd', 'dcb'], {}],
+    [form_product_focussed_team_assembly, ['abcd', 'dcb'], {}],
+    [form_late_product_differentiation, ['xabcy', 'abcz'], {'w_standard': ['abc', 'x']}],
+]
+
+
+@pytest.mark.parametrize('func, words, kwargs', grid_test_token_generation)
+def test_token_generation(func, words, kwargs):
+    """
+    Encoding every character as a (multi-character) token results in an isomorphic system with
+    one source per token.
+    """
+    alphabet = Alphabet()
+    # Use multi-character tokens to make sure that they are not split up
+    encode = lambda w: alphabet.encode(['part-' + c for c in w])
+    system = AssemblySystem.generate(func, *words, **kwargs)
+    token_system = AssemblySystem.generate(
+        func,
+        *[encode(w) for w in words],
+        **{k: [encode(w) for w in v] for k, v in kwargs.items()}
+    )
+    assert nx.is_isomorphic(system.to_digraph(), token_system.to_digraph())
+    assert {s.word for s in token_system.get_nodes_of_type(Source)} == {
+        encode(c) for w in words for c in w
+    }
+    assert {s.word for s in token_system.get_nodes_of_type(Sink)} == {encode(w) for w in words}
+    assert 'label="0"' in token_system.to_graphviz()
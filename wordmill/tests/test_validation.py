@@ -0,0 +1,124 @@
+"""
+Function tests the `wordmill.validation` module.
+"""
+import pytest
+
+from wordmill import AssemblySystem, Source, Sink, Machine, Inventory, form_edge
+from wordmill.algorithms import form_bio_inspired_assembly
+from wordmill.validation import validate, validate_nodes
+
+
+def test_validate_generated_system():
+    """
+    Generated systems must not have any problems.
+    """
+    system = AssemblySystem.generate(form_bio_inspired_assembly, 'abcde', 'cdef')
+    report = validate(system)
+    assert report.valid and bool(report)
+    assert report.n_nodes == len(system.get_nodes_of_type(object))
+    assert report.n_edges == len(system.to_digraph().edges)
+
+
+def _unchecked_edge(source, sink):
+    """
+    Register an edge with both nodes without the checks done by :func:`form_edge`.
+    """
+    source._output_nodes = list(source.output_nodes) + [sink]
+    sink._input_nodes = list(sink.input_nodes) + [source]
+
+
+def _broken_type():
+    source, inv, sink = Source('a'), Inventory('a'), Sink('a')
+    form_edge(source, inv)
+    form_edge(inv, sink)
+    _unchecked_edge(source, Sink('a'))
+    return [source, inv, sink, source.output_nodes[-1]]
+
+
+def _broken_word():
+    source, inv, sink = Source('a'), Inventory('b'), Sink('b')
+    _unchecked_edge(source, inv)
+    form_edge(inv, sink)
+    return [source, inv, sink]
+
+
+def _broken_symmetry():
+    source, inv, sink = Source('a'), Inventory('a'), Sink('a')
+    form_edge(source, inv)
+    inv.form_outbound_edge(sink)
+    return [source, inv, sink]
+
+
+def _broken_symmetry_at_hub():
+    # Adjacency lists of hubs are checked via sets
+    source, sink = Source('a'), Sink('a')
+    nodes = [source, sink]
+    for _ in range(20):
+        inv = Inventory('a')
+        form_edge(source, inv)
+        nodes.append(inv)
+    for inv in nodes[2:]:
+        inv.form_outbound_edge(sink)
+    sink.form_inbound_edge(nodes[2])
+    return nodes
+
+
+def _broken_symmetry_with_duplicate_edge():
+    # The edge from `inv` is formed twice but registered once, so that the input lists of the
+    # machine are as long as the output lists pointing to it
+    source, inv, other, m = Source('a'), Inventory('a'), Inventory('a'), Machine('a', 'a')
+    inv_aa, sink = Inventory('aa'), Sink('aa')
+    form_edge(source, inv)
+    form_edge(source, other)
+    inv.form_outbound_edge(m)
+    inv.form_outbound_edge(m)
+    m.form_inbound_edge(inv)
+    m.form_inbound_edge(other)
+    form_edge(m, inv_aa)
+    form_edge(inv_aa, sink)
+    return [source, inv, other, m, inv_aa, sink]
+
+
+def _broken_coverage():
+    inv_a, inv_b, m = Inventory('a'), Inventory('b'), Machine('a', 'b')
+    inv_ab, sink = Inventory('ab'), Sink('ab')
+    form_edge(Source('a'), inv_a)
+    form_edge(inv_a, m)
+    form_edge(m, inv_ab)
+    form_edge(inv_ab, sink)
+    return [inv_a.input_nodes[0], inv_a, inv_b, m, inv_ab, sink]
+
+
+grid_test_validate_problems = [
+    # Structure
+    # - Function creating a list of nodes with a problem
+    # - Dictionary, keyed by category, with the expected number of problems
+    [_broken_type, {'type': 1}],
+    [_broken_word, {'word': 1, 'coverage': 1}],
+    [_broken_symmetry, {'symmetry': 1, 'coverage': 1}],
+    [_broken_symmetry_at_hub, {'symmetry': 19}],
+    [_broken_symmetry_with_duplicate_edge, {'symmetry': 1, 'coverage': 1}],
+    [_broken_coverage, {'coverage': 3}],
+]
+
+
+@pytest.mark.parametrize('create_nodes, expected_counts', grid_test_validate_problems)
+def test_validate_problems(create_nodes, expected_counts):
+    """
+    All problems are reported, not just the first one.
+    """
+    report = validate_nodes(create_nodes())
+    assert not report.valid
+    assert report.count_by_kind() == expected_counts
+    assert len(str(report).splitlines()) == 1 + sum(expected_counts.values())
+
+
+def test_discover_diagnostics():
+    """
+    :meth:`AssemblySystem.discover` reports the offending nodes.
+    """
+    inv_a, inv_b, m = Inventory('a'), Inventory('b'), Machine('a', 'b')
+    form_edge(Source('a'), inv_a)
+    form_edge(inv_a, m)
+    with pytest.raises(ValueError, match=r"Machine\('a', 'b'\): no input node provides 'b'"):
+        AssemblySystem.discover([m])
@@ -0,0 +1,100 @@
+"""
+Support for symbolic alphabets, i.e. atomic parts that are not single characters
+but tokens from a catalog (e.g. part numbers).
+
+Words over such an alphabet are represented by tuples of integer token ids. All
+generating functions in :mod:`wordmill.algorithms` and all node types operate on
+these tuples in the same way as on strings: slicing yields sub-words, `+`
+concatenates words and every token (a 1-tuple) is provided by its own
+:class:`~wordmill.node_types.Source`.
+"""
+from __future__ import annotations
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+
+class Alphabet:
+    """
+    Bidirectional mapping between catalog tokens (any hashable object, e.g. part
+    number strings) and the integer token ids used in words.
+
+    Example:
+        >>> alphabet = Alphabet()
+        >>> word = alphabet.encode(['PN-100', 'PN-200', 'PN-100'])
+        >>> word
+        (0, 1, 0)
+        >>> alphabet.decode(word[1:])
+        ['PN-200', 'PN-100']
+    """
+    def __init__(self, tokens: Iterable[Hashable] = ()):
+        """
+        Constructor.
+
+        Args:
+            tokens: Tokens to register in the given order.
+        """
+        self._ids: Dict[Hashable, int] = {}
+        self._tokens: List[Hashable] = []
+        for t in tokens:
+            self.token_id(t)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __contains__(self, token: Hashable) -> bool:
+        return token in self._ids
+
+    def token_id(self, token: Hashable) -> int:
+        """
+        Id of a token. Unknown tokens are registered with the next free id.
+
+        Args:
+            token: Catalog token.
+
+        Returns:
+            Integer token id.
+        """
+        token_id = self._ids.get(token)
+        if token_id is None:
+            token_id = self._ids[token] = len(self._tokens)
+            self._tokens.append(token)
+        return token_id
+
+    def encode(self, tokens: Iterable[Hashable]) -> Tuple[int, ...]:
+        """
+        Translate a sequence of catalog tokens into a word.
+
+        Args:
+            tokens: Sequence of catalog tokens.
+
+        Returns:
+            Word, i.e. tuple of token ids.
+        """
+        return tuple(self.token_id(t) for t in tokens)
+
+    def decode(self, word: Tuple[int, ...]) -> List[Hashable]:
+        """
+        Translate a word back into the sequence of catalog tokens.
+
+        Args:
+            word: Tuple of token ids.
+
+        Returns:
+            List of catalog tokens.
+
+        Raises:
+            IndexError: If `word` contains an unknown token id.
+        """
+        return [self._tokens[i] for i in word]
+
+    def label(self, word: Tuple[int, ...], separator: str = ' ') -> str:
+        """
+        Printable representation of a word in terms of catalog tokens.
+
+        Args:
+            word: Tuple of token ids.
+            separator: String to put between tokens.
+
+        Returns:
+            Label.
+        """
+        return separator.join(str(t) for t in self.decode(word))
@@ -0,0 +1,338 @@
+"""
+Validation of (large) assembly systems.
+
+In contrast to :attr:`Node.fully_connected`, which is evaluated node by node and
+only answers yes or no, the functions in this module check all nodes of a system
+in a single sweep and collect every problem they find:
+
+* ``'type'``: An edge connects nodes of classes that must not be connected
+  directly (e.g. a :class:`Source` and a :class:`Machine`).
+* ``'word'``: The nodes of an edge do not share a word.
+* ``'symmetry'``: An edge is only registered with one of its two nodes.
+* ``'coverage'``: A node lacks an input node for one of its input words or has
+  fewer input/output nodes than input/output words.
+
+The sweep works directly on the node objects and needs a constant number of
+look-ups per edge. :func:`check_coverage` only performs the coverage checks; it is
+used by :meth:`AssemblySystem.discover
+<wordmill.node_types.AssemblySystem.discover>`, as :func:`~wordmill.node_types.form_edge`
+already enforces the type and word rules when edges are formed.
+"""
+from __future__ import annotations
+import operator
+from collections import Counter
+from itertools import chain
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set
+
+from wordmill.node_types import Node, AssemblySystem
+
+
+class ValidationIssue(NamedTuple):
+    """
+    Single problem found during validation.
+    """
+    #: Node the problem was found at.
+    node: Node
+    #: Category of the problem, one of ``'type'``, ``'word'``, ``'symmetry'`` or ``'coverage'``.
+    kind: str
+    #: Human readable description.
+    message: str
+    #: Other node of the offending edge (if the problem concerns an edge).
+    other: Optional[Node] = None
+
+    def __str__(self) -> str:
+        if self.other is None:
+            return '{!r}: {}'.format(self.node, self.message)
+        return '{!r}: {} {!r}'.format(self.node, self.message, self.other)
+
+
+class ValidationReport:
+    """
+    Complete result of a validation run.
+    """
+    def __init__(self, issues: List[ValidationIssue], n_nodes: int, n_edges: int):
+        """
+        Constructor.
+
+        Args:
+            issues: All problems found.
+            n_nodes: Number of validated nodes.
+            n_edges: Number of validated edges.
+        """
+        self.issues = issues
+        self.n_nodes = n_nodes
+        self.n_edges = n_edges
+
+    @property
+    def valid(self) -> bool:
+        """
+        Binary predicate indicating if no problems were found.
+
+        Returns:
+            Binary predicate.
+        """
+        return len(self.issues) == 0
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+    def count_by_kind(self) -> Dict[str, int]:
+        """
+        Number of problems per category.
+
+        Returns:
+            Dictionary, keyed by category, holding the number of problems.
+        """
+        counts: Dict[str, int] = {}
+        for issue in self.issues:
+            counts[issue.kind] = counts.get(issue.kind, 0) + 1
+        return counts
+
+    def format(self, max_issues: Optional[int] = 20) -> str:
+        """
+        Human readable summary of the report.
+
+        Args:
+            max_issues: Maximum number of individual problems to list. All
+                problems are listed if ``None``.
+
+        Returns:
+            Summary.
+        """
+        lines = ['Validated {} nodes and {} edges: {}'.format(
+            self.n_nodes,
+            self.n_edges,
+            'no problems found' if self.valid else ', '.join(
+                '{} {} problem(s)'.format(count, kind)
+                for kind, count in sorted(self.count_by_kind().items())
+            )
+        )]
+        shown = self.issues if max_issues is None else self.issues[:max_issues]
+        lines += ['\t{}'.format(issue) for issue in shown]
+        if len(shown) < len(self.issues):
+            lines.append('\t... and {} more'.format(len(self.issues) - len(shown)))
+        return '\n'.join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+# Adjacency lists longer than this are converted to sets to check the symmetry of edges.
+_MAX_SCAN_LENGTH = 16
+
+# The checks below read the slots of the nodes directly, as the property calls would dominate
+# the runtime of a sweep over a large system.
+_input_nodes = operator.attrgetter('_input_nodes')
+_output_nodes = operator.attrgetter('_output_nodes')
+
+
+def _covered(n: Node) -> bool:
+    """
+    Binary predicate indicating if `n` has an input node for every input word and at least as
+    many input/output nodes as input/output words, i.e. if it has no coverage problem.
+    """
+    input_nodes = n._input_nodes
+    if len(input_nodes) < len(n._inputs) or len(n._output_nodes) < len(n._outputs):
+        return False
+    for w in n._inputs:
+        for i in input_nodes:
+            if w in i._outputs:
+                break
+        else:
+            return False
+    return True
+
+
+def _coverage_issues(n: Node, node_set: Optional[Set[Node]] = None) -> List[ValidationIssue]:
+    """
+    Coverage problems of a single node. Input nodes outside of `node_set` (if given) do not
+    provide any words.
+    """
+    issues = []
+    input_nodes = n._input_nodes
+    if node_set is not None:
+        input_nodes = [i for i in input_nodes if i in node_set]
+    provided = {w for i in input_nodes for w in i._outputs}
+    missing = [w for w in n._inputs if w not in provided]
+    if len(missing) > 0:
+        issues.append(ValidationIssue(n, 'coverage', 'no input node provides {}'.format(
+            ', '.join(repr(w) for w in missing)
+        )))
+    elif len(n._input_nodes) < len(n._inputs):
+        issues.append(ValidationIssue(n, 'coverage', '{} input node(s) for {} input word(s)'.format(
+            len(n._input_nodes), len(n._inputs)
+        )))
+    if len(n._output_nodes) < len(n._outputs):
+        issues.append(ValidationIssue(
+            n, 'coverage', '{} output node(s) for {} output word(s)'.format(
+                len(n._output_nodes), len(n._outputs)
+            )
+        ))
+    return issues
+
+
+def check_coverage(nodes: Sequence[Node]) -> ValidationReport:
+    """
+    Check only the input/output coverage of all `nodes`, see :func:`validate_nodes`.
+
+    Args:
+        nodes: Nodes to check.
+
+    Returns:
+        Report listing all coverage problems found.
+    """
+    issues = []
+    n_edges = 0
+    for n in nodes:
+        output_nodes = n._output_nodes
+        n_edges += len(output_nodes)
+        inputs = n._inputs
+        # Inline fast path for the common case of a single input word, see _covered
+        if len(inputs) == 1 and len(output_nodes) >= len(n._outputs):
+            w = inputs[0]
+            for i in n._input_nodes:
+                if w in i._outputs:
+                    break
+            else:
+                issues += _coverage_issues(n)
+        elif not _covered(n):
+            issues += _coverage_issues(n)
+    return ValidationReport(issues, len(nodes), n_edges)
+
+
+def validate_nodes(nodes: Sequence[Node]) -> ValidationReport:
+    """
+    Check bipartite type rules, word compatibility of every edge, symmetry of
+    edge registration and input/output coverage of all `nodes`.
+
+    Every edge is checked for type and word compatibility once (at its origin).
+    Symmetry is checked from the side of the origin; the input lists are only
+    checked edge by edge if they cannot match the output lists, e.g. because
+    their total lengths differ. Adjacency lists of nodes with many edges (e.g.
+    sources) are converted to sets once, so that the sweep takes time linear in
+    the number of edges.
+
+    Args:
+        nodes: Nodes to validate. Edges to nodes outside this set are reported.
+
+    Returns:
+        Report listing all problems found.
+    """
+    node_set = set(nodes)
+    # Class rules for every pair of classes in the system
+    classes = set(map(type, nodes))
+    allowed = {c: {d: _allowed(c, d) for d in classes} for c in classes}
+    input_sets: Dict[Node, Set[Node]] = {}
+    issues: List[ValidationIssue] = []
+    unmatched = False
+    for n in nodes:
+        outputs = n._outputs
+        output_nodes = n._output_nodes
+        allowed_outputs = allowed[n.__class__]
+        for o in output_nodes:
+            if o not in node_set:
+                issues.append(ValidationIssue(
+                    n, 'symmetry', 'output node is not part of the system'
+                ))
+                continue
+            if not allowed_outputs[o.__class__]:
+                issues.append(ValidationIssue(
+                    n, 'type', 'class does not allow an edge to output node', o
+                ))
+            o_inputs = o._inputs
+            for w in outputs:
+                if w in o_inputs:
+                    break
+            else:
+                issues.append(ValidationIssue(n, 'word', 'no common word with output node', o))
+            adjacency = o._input_nodes
+            if len(adjacency) > _MAX_SCAN_LENGTH:
+                hub = input_sets.get(o)
+                if hub is None:
+                    hub = input_sets[o] = set(adjacency)
+                adjacency = hub
+            if n not in adjacency:
+                issues.append(ValidationIssue(
+                    n, 'symmetry', 'edge is not registered with output node', o
+                ))
+        if len(output_nodes) > 1 and len(set(output_nodes)) < len(output_nodes):
+            # An edge formed more than once has to be registered as often with its output node
+            if any(
+                    k > 1 and k > o._input_nodes.count(n) for o, k in Counter(output_nodes).items()
+            ):
+                unmatched = True
+        if n._input_nodes and len(n._inputs) == 1 and len(output_nodes) >= len(outputs):
+            # Deferred, see below
+            continue
+        if not _covered(n):
+            issues += _coverage_issues(n, node_set)
+    # If all edges are registered with their output nodes (at least as often as they were
+    # formed), the input lists contain exactly the same edges as the output lists, unless they
+    # are longer or refer to other nodes. Only then, the input lists are checked edge by edge.
+    n_edges = sum(map(len, map(_output_nodes, nodes)))
+    if unmatched or n_edges != sum(map(len, map(_input_nodes, nodes))) \
+            or not all(map(node_set.__contains__, chain.from_iterable(map(_input_nodes, nodes)))) \
+            or any(issue.kind == 'symmetry' for issue in issues):
+        issues += _input_symmetry_issues(nodes, node_set)
+    # A node with a single input word and at least one input node is covered if all of its
+    # input edges passed the word and symmetry checks, as each of these edges was checked for
+    # the word at its origin. Only nodes involved in a failed check are checked explicitly,
+    # unless they were reported above already.
+    suspects = dict.fromkeys(
+        m for issue in issues if issue.kind in ('word', 'symmetry')
+        for m in (issue.node, issue.other) if m in node_set
+    )
+    for n in suspects:
+        if n._input_nodes and len(n._inputs) == 1 \
+                and len(n._output_nodes) >= len(n._outputs) or _covered(n):
+            issues += _coverage_issues(n, node_set)
+    return ValidationReport(issues, len(nodes), n_edges)
+
+
+def _input_symmetry_issues(nodes: Sequence[Node], node_set: Set[Node]) -> List[ValidationIssue]:
+    """
+    Check for every edge in the input lists of `nodes` that it is registered with its input
+    node, see :func:`validate_nodes`.
+    """
+    output_sets: Dict[Node, Set[Node]] = {}
+    issues = []
+    for n in nodes:
+        for i in n._input_nodes:
+            if i not in node_set:
+                issues.append(ValidationIssue(
+                    n, 'symmetry', 'input node is not part of the system'
+                ))
+                continue
+            adjacency = i._output_nodes
+            if len(adjacency) > _MAX_SCAN_LENGTH:
+                hub = output_sets.get(i)
+                if hub is None:
+                    hub = output_sets[i] = set(adjacency)
+                adjacency = hub
+            if n not in adjacency:
+                issues.append(ValidationIssue(
+                    n, 'symmetry', 'edge is not registered with input node', i
+                ))
+    return issues
+
+
+def _allowed(source: type, sink: type) -> bool:
+    """
+    Binary predicate indicating if the class rules allow an edge from a node of class `source`
+    to a node of class `sink`.
+    """
+    return len(source.allowed_output_node_class_names & {c.__name__ for c in sink.__mro__}) > 0 \
+        and len(sink.allowed_input_node_class_names & {c.__name__ for c in source.__mro__}) > 0
+
+
+def validate(system: AssemblySystem) -> ValidationReport:
+    """
+    Validate all nodes of an assembly system, see :func:`validate_nodes`.
+
+    Args:
+        system: Assembly system to validate.
+
+    Returns:
+        Report listing all problems found.
+    """
+    return validate_nodes(system.get_nodes_of_type(Node))